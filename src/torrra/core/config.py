@@ -143,6 +143,7 @@ class Config:
                 "destination_path": "",  # Empty = same as general.download_path
                 "ffmpeg_path": "ffmpeg",
                 "max_parallel_jobs": 5,
+                "hwaccel": "none",  # auto, nvenc, qsv, videotoolbox, vaapi
                 "rules": [],
             },
         }
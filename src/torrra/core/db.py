@@ -1,4 +1,7 @@
+import atexit
 import sqlite3
+import threading
+from collections.abc import Iterator
 from contextlib import contextmanager, suppress
 from pathlib import Path
 
@@ -7,15 +10,59 @@ from platformdirs import user_data_dir
 DB_DIR = Path(user_data_dir("torrra"))
 DB_FILE = DB_DIR / "torrra.db"
 
+# applied once when the shared connection is opened
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
 
-@contextmanager
-def get_db_connection():
+_connection: sqlite3.Connection | None = None
+# serializes access to the shared connection across threads
+# (textual workers, asyncio.to_thread), re-entrant for nested use
+_lock = threading.RLock()
+
+
+def _connect() -> sqlite3.Connection:
     DB_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_FILE)
-    try:
-        yield conn
-    finally:
-        conn.close()
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+@contextmanager
+def get_db_connection() -> Iterator[sqlite3.Connection]:
+    """Yield the long-lived, lazily opened database connection.
+
+    The connection is shared for the lifetime of the process and is not closed
+    on exit of the block; an uncommitted transaction is rolled back on error.
+    """
+    global _connection
+
+    with _lock:
+        if _connection is None:
+            _connection = _connect()
+        try:
+            yield _connection
+        except BaseException:
+            _connection.rollback()
+            raise
+
+
+def close_db_connection() -> None:
+    """Close the shared connection, a new one is opened on next use."""
+    global _connection
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+
+
+atexit.register(close_db_connection)
 
 
 def init_db() -> None:
@@ -51,9 +98,34 @@ def init_db() -> None:
                 progress REAL DEFAULT 0,
                 error_message TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at REAL NOT NULL DEFAULT 0,
                 FOREIGN KEY (magnet_uri) REFERENCES torrents(magnet_uri)
                     ON DELETE CASCADE
             )
             """
         )
+        # migration code
+        with suppress(sqlite3.OperationalError):
+            cursor.execute(
+                "ALTER TABLE transcode_jobs "
+                "ADD COLUMN updated_at REAL NOT NULL DEFAULT 0"
+            )
+        # queue lookups filter by status and order by creation time
+        with suppress(sqlite3.OperationalError):
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_transcode_status_created
+                ON transcode_jobs (status, created_at)
+                """
+            )
+        # the ui polls for jobs changed since its last look
+        with suppress(sqlite3.OperationalError):
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_transcode_updated
+                ON transcode_jobs (updated_at)
+                """
+            )
         conn.commit()
+        # refresh planner statistics where sqlite deems it useful
+        cursor.execute("PRAGMA optimize")
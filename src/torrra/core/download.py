@@ -1,4 +1,10 @@
+import asyncio
+import atexit
 import hashlib
+import os
+import threading
+import time
+from contextlib import suppress
 from functools import lru_cache
 from pathlib import Path
 
@@ -25,15 +31,37 @@ class DownloadManager:
     }
 
     def __init__(self) -> None:
-        settings = {"listen_interfaces": "0.0.0.0:6881"}
+        settings = {
+            "listen_interfaces": "0.0.0.0:6881",
+            # status alerts carry metadata_received_alert
+            "alert_mask": lt.alert.category_t.error_notification
+            | lt.alert.category_t.status_notification,
+        }
 
         self.session: lt.session = lt.session(settings)
+        # resolved once instead of on every add_torrent call
+        self._download_path: str = get_config().get("general.download_path")
         self.torrents: dict[str, lt.torrent_handle] = {}
         self._metadata_updated: set[str] = (
             set()
         )  # Track torrents whose metadata has been updated
 
+        # alerts are popped from both the ui and the resume-data worker
+        # thread, _process_alerts dispatches them under this lock
+        self._alert_lock: threading.Lock = threading.Lock()
+        self._handle_uris: dict[lt.torrent_handle, str] = {}
+        # latest status per torrent, fed by state_update_alert
+        self._status_cache: dict[str, TorrentStatus] = {}
+        # resume data (None if saving failed) collected from alerts
+        self._resume_data: dict[str, bytes | None] = {}
+        # events set on metadata_received_alert, see wait_for_metadata
+        self._metadata_waiters: dict[
+            lt.torrent_handle, tuple[asyncio.AbstractEventLoop, asyncio.Event]
+        ] = {}
+        self._alert_loop: asyncio.AbstractEventLoop | None = None
+
     @staticmethod
+    @lru_cache(maxsize=4096)  # uri -> path never changes, skip re-hashing
     def _resume_data_path(magnet_uri: str) -> Path:
         uri_hash = hashlib.sha1(magnet_uri.encode()).hexdigest()
         return RESUME_DATA_DIR / f"{uri_hash}.fastresume"
@@ -44,7 +72,7 @@ class DownloadManager:
             handle = self.torrents[magnet_uri]
             if not handle.is_valid():
                 # If handle is invalid, remove it and add the torrent fresh
-                del self.torrents[magnet_uri]
+                self._untrack(magnet_uri)
             else:
                 # Check current paused state and update if different
                 current_status = handle.status()
@@ -60,28 +88,42 @@ class DownloadManager:
         if resume_file.exists():
             try:
                 atp = lt.read_resume_data(resume_file.read_bytes())
-                atp.save_path = get_config().get("general.download_path")
+                atp.save_path = self._download_path
                 if is_paused:
                     atp.flags |= lt.torrent_flags.paused
-                self.torrents[magnet_uri] = self.session.add_torrent(atp)
+                self._track(magnet_uri, self.session.add_torrent(atp))
                 return
             except Exception:
                 resume_file.unlink(missing_ok=True)
 
         # Parse the magnet URI into torrent parameters (modern libtorrent 2.x API)
         atp = lt.parse_magnet_uri(magnet_uri)
-        atp.save_path = get_config().get("general.download_path")
+        atp.save_path = self._download_path
         if is_paused:
             atp.flags |= lt.torrent_flags.paused
 
         # Add the torrent to the session and start tracking
-        self.torrents[magnet_uri] = self.session.add_torrent(atp)
+        self._track(magnet_uri, self.session.add_torrent(atp))
+
+    def _track(self, magnet_uri: str, handle: lt.torrent_handle) -> None:
+        self.torrents[magnet_uri] = handle
+        self._handle_uris[handle] = magnet_uri
+
+    def _untrack(self, magnet_uri: str) -> None:
+        handle = self.torrents.pop(magnet_uri)
+        with self._alert_lock:
+            self._handle_uris.pop(handle, None)
+            self._status_cache = {
+                uri: status
+                for uri, status in self._status_cache.items()
+                if uri != magnet_uri
+            }
 
     def remove_torrent(self, magnet_uri: str) -> None:
         handle = self.torrents.get(magnet_uri)
         if handle and handle.is_valid():
             self.session.remove_torrent(handle)
-            del self.torrents[magnet_uri]
+            self._untrack(magnet_uri)
         self._resume_data_path(magnet_uri).unlink(missing_ok=True)
 
     def toggle_pause(self, magnet_uri: str) -> None:
@@ -95,12 +137,15 @@ class DownloadManager:
         else:  # if not paused
             handle.pause()
 
-    def get_torrent_status(self, magnet_uri: str) -> TorrentStatus | None:
-        handle = self.torrents.get(magnet_uri)
-        if not handle or not handle.is_valid():
-            return None
+        # callers read the new paused state right away, don't wait for the alert
+        with self._alert_lock:
+            self._status_cache = {
+                **self._status_cache,
+                magnet_uri: self._to_status(handle.status()),
+            }
 
-        s = handle.status()
+    @staticmethod
+    def _to_status(s: lt.torrent_status) -> TorrentStatus:
         return TorrentStatus(
             state=s.state,
             progress=s.progress * 100,
@@ -111,6 +156,21 @@ class DownloadManager:
             is_paused=(s.flags & lt.torrent_flags.paused) != 0,
         )
 
+    def get_torrent_status(self, magnet_uri: str) -> TorrentStatus | None:
+        if status := self._status_cache.get(magnet_uri):
+            return status
+
+        # not reported by libtorrent yet, e.g. right after being added
+        handle = self.torrents.get(magnet_uri)
+        if not handle or not handle.is_valid():
+            return None
+        return self._to_status(handle.status())
+
+    def get_all_torrent_statuses(self) -> dict[str, TorrentStatus]:
+        """Cached statuses of all torrents reported by update_statuses."""
+        # the dict is swapped on update, never mutated, so it's safe to iterate
+        return self._status_cache
+
     def get_torrent_state_text(self, status: TorrentStatus, short: bool = False) -> str:
         if status["is_paused"]:
             return "Paused" if not short else "PD"
@@ -128,19 +188,19 @@ class DownloadManager:
         if not torrent_info:
             return []
 
-        save_path = handle.status().save_path
-        files = []
+        # libtorrent returns native separators, so plain concatenation with a
+        # trailing-separator prefix matches Path joining without the overhead
+        prefix = os.path.join(handle.status().save_path, "")
         file_storage = torrent_info.files()
-        for i in range(file_storage.num_files()):
-            file_path = file_storage.file_path(i)
-            full_path = str(Path(save_path) / file_path)
-            files.append(full_path)
-        return files
+        file_path = file_storage.file_path
+        return [prefix + file_path(i) for i in range(file_storage.num_files())]
 
-    def check_metadata_updates(self) -> None:
+    def check_metadata_updates(self) -> bool:
+        """Store titles/sizes of torrents whose metadata arrived, True if any."""
         from torrra.core.torrent import get_torrent_manager
 
         tm = get_torrent_manager()
+        updates: list[tuple[str, str, int]] = []
 
         for magnet_uri, handle in self.torrents.items():
             # Only check for metadata if we haven't updated it yet
@@ -155,65 +215,135 @@ class DownloadManager:
                     if torrent_info:
                         title = torrent_info.name()
                         size = torrent_info.total_size()
-
-                        # Update the database with the actual metadata
-                        tm.update_torrent_metadata(magnet_uri, title, size)
-                        # Mark this torrent as having its metadata updated
-                        self._metadata_updated.add(magnet_uri)
+                        updates.append((magnet_uri, title, size))
                 except (AttributeError, RuntimeError):
                     # Skip if metadata is not fully available yet
                     continue
 
+        if updates:
+            # Update the database with the actual metadata in one transaction
+            tm.update_torrents_metadata(updates)
+            # Mark these torrents as having their metadata updated
+            self._metadata_updated.update(uri for uri, _, _ in updates)
+        return bool(updates)
+
+    def update_statuses(self) -> None:
+        """Apply received status updates and request the next batch.
+
+        libtorrent answers post_torrent_updates() with one state_update_alert
+        holding only the torrents that changed since the previous request.
+        """
+        self._process_alerts()
+        self.session.post_torrent_updates(0)
+
+    def _start_alert_pump(self) -> None:
+        """Dispatch alerts on the running loop as soon as libtorrent posts them."""
+        loop = asyncio.get_running_loop()
+        if self._alert_loop is loop:
+            return
+
+        def on_alert() -> None:
+            # called from a libtorrent thread, must not block or pop alerts
+            with suppress(RuntimeError):  # loop already closed
+                loop.call_soon_threadsafe(self._process_alerts)
+
+        if self._alert_loop is None:
+            # libtorrent threads outlive the interpreter's atexit phase, calling
+            # into python after that aborts the process
+            atexit.register(self.session.set_alert_notify, None)
+        self._alert_loop = loop
+        self.session.set_alert_notify(on_alert)
+
+    async def wait_for_metadata(
+        self, handle: lt.torrent_handle, timeout: float
+    ) -> bool:
+        """Wait until the torrent's metadata arrives, False on timeout."""
+        self._start_alert_pump()
+        event = asyncio.Event()
+        with self._alert_lock:
+            self._metadata_waiters[handle] = (asyncio.get_running_loop(), event)
+
+        try:
+            # the alert could have been handled before the waiter was registered
+            if not handle.has_metadata():
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout)
+            return handle.has_metadata()
+        finally:
+            with self._alert_lock:
+                self._metadata_waiters.pop(handle, None)
+
+    def _process_alerts(self) -> None:
+        with self._alert_lock:
+            for alert in self.session.pop_alerts():
+                alert_type = type(alert)
+                if alert_type is lt.state_update_alert:
+                    updates = {
+                        uri: self._to_status(status)
+                        for status in alert.status
+                        if (uri := self._handle_uris.get(status.handle))
+                    }
+                    # swap in a new dict so readers on another thread
+                    # never see it change size mid-iteration
+                    if updates:
+                        self._status_cache = {**self._status_cache, **updates}
+                elif alert_type is lt.save_resume_data_alert:
+                    if uri := self._handle_uris.get(alert.handle):
+                        self._resume_data[uri] = lt.write_resume_data_buf(
+                            alert.params
+                        )
+                elif alert_type is lt.save_resume_data_failed_alert:
+                    if uri := self._handle_uris.get(alert.handle):
+                        self._resume_data[uri] = None
+                elif alert_type is lt.metadata_received_alert:
+                    if waiter := self._metadata_waiters.get(alert.handle):
+                        # alerts may be drained off the loop thread
+                        loop, event = waiter
+                        loop.call_soon_threadsafe(event.set)
+
     def enforce_seeding_policy(self) -> None:
         """Pause completed torrents if disable_seeding is enabled."""
         if not get_config().get("general.disable_seeding", False):
             return
 
-        for handle in self.torrents.values():
-            if not handle.is_valid():
-                continue
-
-            status = handle.status()
-            is_paused = (status.flags & lt.torrent_flags.paused) != 0
-            is_seeding = status.state in (
+        # cached statuses from update_statuses, no per-torrent status() call
+        for magnet_uri, status in self._status_cache.items():
+            is_seeding = status["state"] in (
                 lt.torrent_status.states.seeding,
                 lt.torrent_status.states.finished,
             )
+            if not is_seeding or status["is_paused"]:
+                continue
 
-            if is_seeding and not is_paused:
+            handle = self.torrents.get(magnet_uri)
+            if handle and handle.is_valid():
                 handle.pause()
 
     def save_all_resume_data(self) -> None:
         """Save resume data for all torrents to disk."""
         RESUME_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+        pending: set[str] = set()
         for magnet_uri, handle in self.torrents.items():
             if not handle.is_valid() or not handle.has_metadata():
                 continue
             try:
                 handle.save_resume_data()
+                pending.add(magnet_uri)
             except Exception:
                 continue
 
         # Collect alerts to write resume data files
-        import time
-
         deadline = time.monotonic() + 5
-        pending = {uri for uri, h in self.torrents.items() if h.is_valid() and h.has_metadata()}
-
         while pending and time.monotonic() < deadline:
             self.session.wait_for_alert(1000)
-            for alert in self.session.pop_alerts():
-                if isinstance(alert, lt.save_resume_data_alert):
-                    data = lt.write_resume_data_buf(alert.params)
-                    # Find the magnet_uri for this handle
-                    for uri, h in self.torrents.items():
-                        if h == alert.handle:
-                            self._resume_data_path(uri).write_bytes(data)
-                            pending.discard(uri)
-                            break
-                elif isinstance(alert, lt.save_resume_data_failed_alert):
-                    for uri, h in self.torrents.items():
-                        if h == alert.handle:
-                            pending.discard(uri)
-                            break
+            self._process_alerts()
+            pending.difference_update(self._resume_data)
+
+        with self._alert_lock:
+            results, self._resume_data = self._resume_data, {}
+
+        # write files only after draining so disk i/o doesn't delay alerts
+        for uri, data in results.items():
+            if data is not None:
+                self._resume_data_path(uri).write_bytes(data)
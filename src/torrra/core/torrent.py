@@ -62,10 +62,22 @@ class TorrentManager:
             )
             conn.commit()
 
+    def update_torrents_metadata(self, updates: list[tuple[str, str, int]]) -> None:
+        if not updates:
+            return
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE torrents SET title = ?, size = ? WHERE magnet_uri = ?",
+                [(title, size, magnet_uri) for magnet_uri, title, size in updates],
+            )
+            conn.commit()
+
     def get_all_torrents(self) -> list[TorrentRecord]:
         with get_db_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute("SELECT * FROM torrents")
             rows = cursor.fetchall()
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
 import os
+import sqlite3
 import subprocess
 from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 from torrra.core.config import get_config
 from torrra.core.db import get_db_connection
@@ -34,6 +38,16 @@ class TranscodeJob(TypedDict):
     progress: float
     error_message: str | None
     created_at: str
+    updated_at: float  # unix time of the last write to the row
+
+
+class VideoProbe(TypedDict):
+    """Stream details of a source file, as reported by ffprobe."""
+
+    duration: float | None  # seconds
+    video_codec: str | None
+    height: int | None
+    audio_codec: str | None
 
 
 @lru_cache
@@ -43,7 +57,64 @@ def get_transcode_manager() -> TranscodeManager:
 
 def check_ffmpeg_available() -> bool:
     """Check if ffmpeg is available."""
-    ffmpeg_path = get_config().get("transcoding.ffmpeg_path", "ffmpeg")
+    return _check_ffmpeg(get_config().get("transcoding.ffmpeg_path", "ffmpeg"))
+
+
+async def _run_ffmpeg(cmd: list[str], timeout: float) -> bytes | None:
+    """Run a short ffmpeg helper command, its stdout on success, None otherwise."""
+    process = None
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        if process and process.returncode is None:
+            process.kill()
+        return None
+    except OSError:
+        return None
+    return stdout if process.returncode == 0 else None
+
+
+async def _ffmpeg_encoders(ffmpeg_path: str) -> frozenset[str]:
+    """List the encoders ffmpeg was built with."""
+    stdout = await _run_ffmpeg([ffmpeg_path, "-hide_banner", "-encoders"], timeout=5)
+    if stdout is None:
+        return frozenset()
+    # lines look like: " V....D h264_nvenc    NVIDIA NVENC H.264 encoder"
+    return frozenset(
+        parts[1]
+        for line in stdout.decode(errors="replace").splitlines()
+        if len(parts := line.split()) > 1
+    )
+
+
+async def _hw_encoder_works(ffmpeg_path: str, name: str) -> bool:
+    """Encode a single blank frame with a HW_ENCODERS entry."""
+    encoder, input_args, encoder_args, hw_filter = HW_ENCODERS[name]
+    cmd = [
+        ffmpeg_path,
+        "-hide_banner",
+        *input_args,
+        "-f",
+        "lavfi",
+        "-i",
+        "color=size=256x256",
+        "-frames:v",
+        "1",
+    ]
+    if hw_filter:
+        cmd.extend(["-vf", hw_filter])
+    cmd.extend(["-c:v", encoder, *encoder_args, "-f", "null", "-"])
+    return await _run_ffmpeg(cmd, timeout=10) is not None
+
+
+@lru_cache(maxsize=8)
+def _check_ffmpeg(ffmpeg_path: str) -> bool:
+    """Run `ffmpeg -version` once per path, use cache_clear() to re-check."""
     try:
         result = subprocess.run(
             [ffmpeg_path, "-version"],
@@ -55,17 +126,73 @@ def check_ffmpeg_available() -> bool:
         return False
 
 
+# Seconds between batched progress writes
+PROGRESS_FLUSH_INTERVAL = 0.5
+# Bytes read from ffmpeg's progress pipe at once
+PROGRESS_READ_SIZE = 8192
+# Bytes read from ffmpeg's stderr at once
+STDERR_READ_SIZE = 4096
+# Bytes of ffmpeg's stderr kept for the error message of failed jobs
+STDERR_TAIL_SIZE = 500
+
+# Hardware H.264 encoders per transcoding.hwaccel value, in "auto" preference
+# order: (encoder, input options, encoder options, filter appended to -vf)
+HW_ENCODERS: dict[str, tuple[str, list[str], list[str], str | None]] = {
+    "nvenc": (
+        "h264_nvenc",
+        ["-hwaccel", "cuda"],
+        ["-preset", "p5", "-rc", "vbr", "-cq", "23"],
+        None,
+    ),
+    "qsv": ("h264_qsv", [], ["-global_quality", "23"], None),
+    "videotoolbox": ("h264_videotoolbox", [], ["-q:v", "55"], None),
+    "vaapi": (
+        "h264_vaapi",
+        ["-vaapi_device", "/dev/dri/renderD128"],
+        ["-qp", "23"],
+        "format=nv12,hwupload",
+    ),
+}
+
+# Output containers that can hold a stream-copied H.264 track
+H264_CONTAINERS = {"mp4", "m4v", "mkv", "mov"}
+
+# Unix time with millisecond precision, stamped on every job write
+_NOW_SQL = "(julianday('now') - 2440587.5) * 86400.0"
+
+_INSERT_JOB_SQL = f"""
+    INSERT INTO transcode_jobs
+        (magnet_uri, source_file, destination_file, status, progress, updated_at)
+    VALUES (?, ?, ?, 'pending', 0, {_NOW_SQL})
+"""
+
+
 class TranscodeManager:
     """Manages transcoding operations using ffmpeg."""
 
     def __init__(self) -> None:
+        # Hot config values, resolved once; they don't change while running
+        config = get_config()
+        self._ffmpeg_path: str = config.get("transcoding.ffmpeg_path", "ffmpeg")
+        # ffprobe is usually alongside ffmpeg
+        self._ffprobe_path: str = self._ffmpeg_path.replace("ffmpeg", "ffprobe")
+        self._max_parallel_jobs: int = config.get("transcoding.max_parallel_jobs", 5)
+        self._hwaccel: str = config.get("transcoding.hwaccel", "none")
+        # Resolved hardware encoder, detected once on the first job
+        self._hw_encoder_task: asyncio.Future[str | None] | None = None
+
         self._active_processes: dict[int, asyncio.subprocess.Process] = {}
-        self._total_durations: dict[int, float] = {}
-        # Callbacks for notifications: (event, filename)
+        # Factor turning ffmpeg's out_time_ms into a percentage, per job
+        self._progress_scales: dict[int, float] = {}
+        # Latest progress per job, written to the database in batches
+        self._progress_buffer: dict[int, float] = {}
+        self._progress_flusher: asyncio.Task[None] | None = None
+        # Extension -> rule lookup, built lazily from config
+        self._rule_index: dict[str, TranscodeRule] | None = None
+        self._rule_index_source: list[TranscodeRule] | None = None
+        # Callback for notifications: (event, filename)
         # Events: "started", "completed", "failed"
-        self._notification_callback: (
-            Callable[[str, str], None] | Callable[[str, str], Awaitable[None]] | None
-        ) = None
+        self._notify_impl: Callable[[str, str], Awaitable[None]] | None = None
 
     def set_notification_callback(
         self,
@@ -75,14 +202,24 @@ class TranscodeManager:
 
         Callback receives (event, filename) where event is "started", "completed", or "failed".
         """
-        self._notification_callback = callback
+        # Decide sync vs async once here instead of on every notification
+        if inspect.iscoroutinefunction(callback):
+            self._notify_impl = cast(Callable[[str, str], Awaitable[None]], callback)
+        else:
+
+            async def _notify_sync(event: str, filename: str) -> None:
+                # plain callables may still hand back an awaitable,
+                # e.g. a lambda wrapping an async function
+                result = callback(event, filename)
+                if inspect.isawaitable(result):
+                    await result
+
+            self._notify_impl = _notify_sync
 
     async def _notify(self, event: str, filename: str) -> None:
         """Send a notification via the callback if set."""
-        if self._notification_callback:
-            result = self._notification_callback(event, filename)
-            if asyncio.iscoroutine(result):
-                await result
+        if self._notify_impl:
+            await self._notify_impl(event, filename)
 
     def get_rules(self) -> list[TranscodeRule]:
         """Get all transcoding rules from config."""
@@ -91,17 +228,27 @@ class TranscodeManager:
             return []
         return rules
 
+    def _get_rule_index(self) -> dict[str, TranscodeRule]:
+        """Get rules keyed by normalized input extension.
+
+        The index is rebuilt whenever the configured rules list is replaced.
+        """
+        rules = self.get_rules()
+        if self._rule_index is None or self._rule_index_source is not rules:
+            index: dict[str, TranscodeRule] = {}
+            for rule in rules:
+                # Normalize extension (handle with or without leading dot)
+                rule_ext = rule.get("input_extension", "").lower()
+                if not rule_ext.startswith("."):
+                    rule_ext = f".{rule_ext}"
+                index.setdefault(rule_ext, rule)  # first matching rule wins
+            self._rule_index = index
+            self._rule_index_source = rules
+        return self._rule_index
+
     def get_matching_rule(self, file_path: str) -> TranscodeRule | None:
         """Find a transcoding rule matching the file extension."""
-        ext = Path(file_path).suffix.lower()
-        for rule in self.get_rules():
-            rule_ext = rule.get("input_extension", "")
-            # Normalize extension (handle with or without leading dot)
-            if not rule_ext.startswith("."):
-                rule_ext = f".{rule_ext}"
-            if ext == rule_ext.lower():
-                return rule
-        return None
+        return self._get_rule_index().get(Path(file_path).suffix.lower())
 
     def get_destination_path(self) -> str:
         """Get the destination path for transcoded files."""
@@ -110,61 +257,121 @@ class TranscodeManager:
             return dest
         return get_config().get("general.download_path")
 
-    def queue_job(self, magnet_uri: str, source_file: str) -> int:
-        """Add a new transcoding job to the database queue."""
+    def _build_job_row(
+        self, magnet_uri: str, source_file: str
+    ) -> tuple[str, str, str] | None:
+        """Build the insert parameters for a job, None if no rule matches."""
         rule = self.get_matching_rule(source_file)
         if not rule:
-            raise ValueError(f"No matching rule for {source_file}")
+            return None
 
         # Build destination file path
         dest_dir = self.get_destination_path()
         source_path = Path(source_file)
         output_format = rule.get("output_format", "mp4")
         dest_file = str(Path(dest_dir) / f"{source_path.stem}.{output_format}")
+        return (magnet_uri, source_file, dest_file)
+
+    def queue_job(self, magnet_uri: str, source_file: str) -> int:
+        """Add a new transcoding job to the database queue."""
+        row = self._build_job_row(magnet_uri, source_file)
+        if not row:
+            raise ValueError(f"No matching rule for {source_file}")
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO transcode_jobs
-                    (magnet_uri, source_file, destination_file, status, progress)
-                VALUES (?, ?, ?, 'pending', 0)
-                """,
-                (magnet_uri, source_file, dest_file),
-            )
+            cursor.execute(_INSERT_JOB_SQL, row)
             conn.commit()
             return cursor.lastrowid or 0
 
+    def queue_jobs(self, rows: list[tuple[str, str, str]]) -> list[int]:
+        """Insert several job rows in a single transaction.
+
+        Returns the created job IDs in insertion order.
+        """
+        if not rows:
+            return []
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_INSERT_JOB_SQL, rows)
+            # ids of one multi-row insert inside a single write transaction
+            # are contiguous, so the range can be rebuilt from the last one
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            conn.commit()
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def get_all_jobs(self) -> list[TranscodeJob]:
         """Get all transcoding jobs."""
         with get_db_connection() as conn:
-            conn.row_factory = _dict_factory
             cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT id, magnet_uri, source_file, destination_file,
-                       status, progress, error_message, created_at
+                       status, progress, error_message, created_at, updated_at
                 FROM transcode_jobs
                 ORDER BY created_at DESC
                 """
             )
-            return cursor.fetchall()
+            return _fetch_dicts(cursor)
+
+    def get_updated_jobs(self, since: float) -> list[TranscodeJob]:
+        """Get jobs written at or after the given unix time.
+
+        Rows stamped exactly at since come back again, so a write landing in
+        the same millisecond as the previous poll is never missed.
+        """
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, magnet_uri, source_file, destination_file,
+                       status, progress, error_message, created_at, updated_at
+                FROM transcode_jobs
+                WHERE updated_at >= ?
+                """,
+                (since,),
+            )
+            return _fetch_dicts(cursor)
+
+    def get_job_count(self) -> int:
+        """Get the total number of jobs."""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM transcode_jobs")
+            row = cursor.fetchone()
+            return row[0] if row else 0
 
     def get_pending_jobs(self) -> list[TranscodeJob]:
         """Get all pending transcoding jobs."""
         with get_db_connection() as conn:
-            conn.row_factory = _dict_factory
             cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT id, magnet_uri, source_file, destination_file,
-                       status, progress, error_message, created_at
+                       status, progress, error_message, created_at, updated_at
                 FROM transcode_jobs
                 WHERE status = 'pending'
                 ORDER BY created_at ASC
                 """
             )
-            return cursor.fetchall()
+            return _fetch_dicts(cursor)
+
+    def get_active_jobs(self) -> list[TranscodeJob]:
+        """Get in-progress and pending jobs, in-progress first, oldest first."""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, magnet_uri, source_file, destination_file,
+                       status, progress, error_message, created_at, updated_at
+                FROM transcode_jobs
+                WHERE status IN ('in_progress', 'pending')
+                ORDER BY status = 'pending', created_at ASC, id ASC
+                """
+            )
+            return _fetch_dicts(cursor)
 
     def get_in_progress_count(self) -> int:
         """Get the count of jobs currently in progress."""
@@ -176,6 +383,15 @@ class TranscodeManager:
             row = cursor.fetchone()
             return row[0] if row else 0
 
+    def get_status_counts(self) -> dict[str, int]:
+        """Get the number of jobs per status."""
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT status, COUNT(*) FROM transcode_jobs GROUP BY status"
+            )
+            return dict(cursor.fetchall())
+
     def update_job_status(
         self,
         job_id: int,
@@ -184,49 +400,51 @@ class TranscodeManager:
         error_message: str | None = None,
     ) -> None:
         """Update a job's status."""
+        # Write pending progress first so it can't overwrite the new state
+        self.flush_progress()
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            if progress is not None and error_message is not None:
-                cursor.execute(
-                    """
-                    UPDATE transcode_jobs
-                    SET status = ?, progress = ?, error_message = ?
-                    WHERE id = ?
-                    """,
-                    (status, progress, error_message, job_id),
-                )
-            elif progress is not None:
-                cursor.execute(
-                    """
-                    UPDATE transcode_jobs
-                    SET status = ?, progress = ?
-                    WHERE id = ?
-                    """,
-                    (status, progress, job_id),
-                )
-            elif error_message is not None:
-                cursor.execute(
-                    """
-                    UPDATE transcode_jobs
-                    SET status = ?, error_message = ?
-                    WHERE id = ?
-                    """,
-                    (status, error_message, job_id),
-                )
-            else:
-                cursor.execute(
-                    "UPDATE transcode_jobs SET status = ? WHERE id = ?",
-                    (status, job_id),
-                )
+            # Single statement so sqlite can reuse the prepared plan;
+            # None leaves the current column value untouched
+            cursor.execute(
+                f"""
+                UPDATE transcode_jobs
+                SET status = ?,
+                    progress = COALESCE(?, progress),
+                    error_message = COALESCE(?, error_message),
+                    updated_at = {_NOW_SQL}
+                WHERE id = ?
+                """,
+                (status, progress, error_message, job_id),
+            )
             conn.commit()
 
     def update_job_progress(self, job_id: int, progress: float) -> None:
-        """Update a job's progress."""
+        """Buffer a job's progress, it is written to the database periodically."""
+        self._progress_buffer[job_id] = progress
+        if self._progress_flusher is None or self._progress_flusher.done():
+            self._progress_flusher = asyncio.create_task(self._flush_progress_loop())
+
+    async def _flush_progress_loop(self) -> None:
+        """Flush buffered progress every interval until an interval brings none."""
+        while True:
+            await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+            if not self._progress_buffer:
+                return
+            self.flush_progress()
+
+    def flush_progress(self) -> None:
+        """Write all buffered progress values in a single transaction."""
+        if not self._progress_buffer:
+            return
+
+        buffered, self._progress_buffer = self._progress_buffer, {}
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE transcode_jobs SET progress = ? WHERE id = ?",
-                (progress, job_id),
+            cursor.executemany(
+                f"UPDATE transcode_jobs SET progress = ?, updated_at = {_NOW_SQL} "
+                "WHERE id = ?",
+                [(progress, job_id) for job_id, progress in buffered.items()],
             )
             conn.commit()
 
@@ -263,25 +481,56 @@ class TranscodeManager:
 
         dm = get_download_manager()
         files = dm.get_torrent_files(magnet_uri)
-        job_ids = []
+        rows = [
+            row
+            for file_path in files
+            if (row := self._build_job_row(magnet_uri, file_path))
+        ]
+        return self.queue_jobs(rows)
 
-        for file_path in files:
-            if self.get_matching_rule(file_path):
-                try:
-                    job_id = self.queue_job(magnet_uri, file_path)
-                    job_ids.append(job_id)
-                except ValueError:
-                    continue
+    async def get_hw_encoder(self) -> str | None:
+        """Resolve transcoding.hwaccel to a HW_ENCODERS key, None for libx264.
 
-        return job_ids
+        Detection runs once, jobs starting together share the same run.
+        """
+        if self._hw_encoder_task is None:
+            self._hw_encoder_task = asyncio.ensure_future(self._detect_hw_encoder())
+        return await asyncio.shield(self._hw_encoder_task)
+
+    async def _detect_hw_encoder(self) -> str | None:
+        if self._hwaccel == "auto":
+            candidates = list(HW_ENCODERS)
+        elif self._hwaccel in HW_ENCODERS:
+            candidates = [self._hwaccel]
+        else:
+            return None
+
+        available = await _ffmpeg_encoders(self._ffmpeg_path)
+        for name in candidates:
+            # Distro builds list encoders for hardware the machine may not
+            # have, so only one that can encode a test frame is used
+            if HW_ENCODERS[name][0] in available and await _hw_encoder_works(
+                self._ffmpeg_path, name
+            ):
+                return name
+        return None
 
     def build_ffmpeg_command(
-        self, source: str, destination: str, rule: TranscodeRule
+        self,
+        source: str,
+        destination: str,
+        rule: TranscodeRule,
+        probe: VideoProbe | None = None,
+        hw_encoder: str | None = None,
     ) -> list[str]:
-        """Build ffmpeg command based on transcoding rule."""
-        ffmpeg_path = get_config().get("transcoding.ffmpeg_path", "ffmpeg")
+        """Build ffmpeg command based on transcoding rule.
+
+        With a probe of the source, H.264 video that needs no downscaling is
+        stream-copied instead of re-encoded. Re-encoding uses the given
+        HW_ENCODERS entry, libx264 without one.
+        """
         cmd = [
-            ffmpeg_path,
+            self._ffmpeg_path,
             "-i",
             source,
             "-y",  # Overwrite output
@@ -291,72 +540,125 @@ class TranscodeManager:
         ]
 
         resolution = rule.get("resolution", "original")
-
-        # Video codec - use libx264 for mp4/m4v compatibility
-        cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
-
-        # Resolution scaling
+        height = None
         if resolution != "original":
             height_map = {"720p": 720, "1080p": 1080, "4k": 2160}
             height = height_map.get(resolution, 1080)
-            # Scale to height while preserving aspect ratio, ensure even dimensions
-            cmd.extend(["-vf", f"scale=-2:{height}"])
-
-        # Audio codec - use AAC for compatibility
-        # Use audio filter to normalize channel layouts (5.1(side) -> 5.1) and ensure
-        # proper channel mapping for formats like EAC3 that use non-standard layouts
-        cmd.extend([
-            "-c:a", "aac",
-            "-b:a", "192k",
-            "-af", "aformat=channel_layouts=5.1|stereo",
-        ])
+
+        # Stream-copy when the source already is H.264 within the target height
+        output_format = rule.get("output_format", "mp4").lower()
+        source_height = probe["height"] if probe else None
+        fits_height = height is None or (
+            source_height is not None and source_height <= height
+        )
+        copy_video = (
+            probe is not None
+            and probe["video_codec"] == "h264"
+            and output_format in H264_CONTAINERS
+            and fits_height
+        )
+
+        if copy_video:
+            cmd.extend(["-c:v", "copy"])
+        else:
+            filters: list[str] = []
+            # Resolution scaling
+            if height is not None:
+                # Scale to height while preserving aspect ratio, ensure even dimensions
+                filters.append(f"scale=-2:{height}")
+
+            if hw_encoder:
+                encoder, input_args, encoder_args, hw_filter = HW_ENCODERS[hw_encoder]
+                # Input options must come before -i
+                cmd[1:1] = input_args
+                cmd.extend(["-c:v", encoder, *encoder_args])
+                if hw_filter:
+                    filters.append(hw_filter)
+            else:
+                # Video codec - use libx264 for mp4/m4v compatibility
+                cmd.extend(["-c:v", "libx264", "-preset", "medium", "-crf", "23"])
+
+            if filters:
+                cmd.extend(["-vf", ",".join(filters)])
+
+        if copy_video and probe and probe["audio_codec"] == "aac":
+            # AAC audio can be carried over as-is too
+            cmd.extend(["-c:a", "copy"])
+        else:
+            # Audio codec - use AAC for compatibility
+            # Use audio filter to normalize channel layouts (5.1(side) -> 5.1) and
+            # ensure proper channel mapping for formats like EAC3 that use
+            # non-standard layouts
+            cmd.extend([
+                "-c:a", "aac",
+                "-b:a", "192k",
+                "-af", "aformat=channel_layouts=5.1|stereo",
+            ])
 
         cmd.append(destination)
         return cmd
 
-    def get_video_duration(self, file_path: str) -> float | None:
-        """Get video duration in seconds using ffprobe."""
-        ffmpeg_path = get_config().get("transcoding.ffmpeg_path", "ffmpeg")
-        # ffprobe is usually alongside ffmpeg
-        ffprobe_path = ffmpeg_path.replace("ffmpeg", "ffprobe")
-
+    async def probe_video(self, file_path: str) -> VideoProbe | None:
+        """Get duration and codecs of a video file with a single ffprobe run."""
+        process = None
         try:
-            result = subprocess.run(
-                [
-                    ffprobe_path,
-                    "-v",
-                    "quiet",
-                    "-show_entries",
-                    "format=duration",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    file_path,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            process = await asyncio.create_subprocess_exec(
+                self._ffprobe_path,
+                "-v",
+                "quiet",
+                "-print_format",
+                "json",
+                "-show_entries",
+                "format=duration:stream=codec_type,codec_name,height",
+                file_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-        except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+            if process.returncode != 0:
+                return None
+            return _parse_probe(json.loads(stdout))
+        except asyncio.TimeoutError:
+            if process and process.returncode is None:
+                process.kill()
+        except (FileNotFoundError, ValueError):
             pass
         return None
 
-    def parse_ffmpeg_progress(self, line: str, job_id: int) -> float | None:
-        """Parse ffmpeg progress output and return percentage."""
+    def parse_ffmpeg_progress(self, line: bytes, job_id: int) -> float | None:
+        """Parse a raw ffmpeg progress line and return percentage."""
         # ffmpeg progress output has lines like: out_time_ms=12345678
-        if line.startswith("out_time_ms="):
-            try:
-                current_ms = int(line.split("=")[1])
-                total_duration = self._total_durations.get(job_id)
-                if total_duration and total_duration > 0:
-                    # Convert ms to seconds and calculate percentage
-                    progress = (current_ms / 1000000) / total_duration * 100
-                    return min(progress, 99.9)  # Cap at 99.9 until complete
-            except (ValueError, IndexError):
-                pass
+        if line.startswith(b"out_time_ms="):
+            scale = self._progress_scales.get(job_id)
+            if scale:
+                try:
+                    current_ms = int(line[12:])
+                except ValueError:
+                    return None
+                return min(current_ms * scale, 99.9)  # Cap at 99.9 until complete
         return None
 
+    async def _read_progress(self, stream: asyncio.StreamReader, job_id: int) -> None:
+        """Drain ffmpeg progress output in large chunks and record progress."""
+        tail = b""
+        while chunk := await stream.read(PROGRESS_READ_SIZE):
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()  # keep a partial last line for the next chunk
+            # Only the newest value in a chunk matters
+            for line in reversed(lines):
+                progress = self.parse_ffmpeg_progress(line, job_id)
+                if progress is not None:
+                    self.update_job_progress(job_id, progress)
+                    break
+
+    async def _read_stderr_tail(self, stream: asyncio.StreamReader) -> bytes:
+        """Drain ffmpeg's stderr, keeping only the last few hundred bytes."""
+        tail = bytearray()
+        while chunk := await stream.read(STDERR_READ_SIZE):
+            tail += chunk
+            del tail[:-STDERR_TAIL_SIZE]
+        return bytes(tail)
+
     async def start_job_async(self, job_id: int, job: TranscodeJob) -> None:
         """Start transcoding a specific job asynchronously."""
         source = job["source_file"]
@@ -382,27 +684,35 @@ class TranscodeManager:
             )
             return
 
-        # Get video duration for progress calculation
-        duration = self.get_video_duration(source)
-        if duration:
-            self._total_durations[job_id] = duration
-
-        # Ensure destination directory exists
-        dest_dir = Path(destination).parent
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        # Build command
-        cmd = self.build_ffmpeg_command(source, destination, rule)
-
+        # Claim the job before the first await, otherwise the next queue pass
+        # still sees it pending and starts it a second time
         self.update_job_status(job_id, "in_progress", progress=0)
 
         # Get filename for notifications
         source_filename = Path(source).name
 
-        # Notify that transcoding started
-        await self._notify("started", source_filename)
-
+        stderr_task: asyncio.Task[bytes] | None = None
         try:
+            # Probe codecs for the copy fast path and duration for progress
+            probe = await self.probe_video(source)
+            duration = probe["duration"] if probe else None
+            if duration and duration > 0:
+                # out_time_ms is in microseconds despite its name
+                self._progress_scales[job_id] = 100e-6 / duration
+
+            # Ensure destination directory exists
+            dest_dir = Path(destination).parent
+            dest_dir.mkdir(parents=True, exist_ok=True)
+
+            # Build command
+            hw_encoder = await self.get_hw_encoder()
+            cmd = self.build_ffmpeg_command(
+                source, destination, rule, probe, hw_encoder
+            )
+
+            # Notify that transcoding started
+            await self._notify("started", source_filename)
+
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
@@ -410,30 +720,25 @@ class TranscodeManager:
             )
             self._active_processes[job_id] = process
 
+            # Drain stderr alongside stdout, keeping only its tail
+            if process.stderr:
+                stderr_task = asyncio.create_task(
+                    self._read_stderr_tail(process.stderr)
+                )
+
             # Read progress from stdout
             if process.stdout:
-                async for line_bytes in process.stdout:
-                    line = line_bytes.decode().strip()
-                    progress = self.parse_ffmpeg_progress(line, job_id)
-                    if progress is not None:
-                        self.update_job_progress(job_id, progress)
+                await self._read_progress(process.stdout, job_id)
 
             await process.wait()
 
-            # Clean up
-            if job_id in self._active_processes:
-                del self._active_processes[job_id]
-            if job_id in self._total_durations:
-                del self._total_durations[job_id]
-
             if process.returncode == 0:
                 self.update_job_status(job_id, "completed", progress=100)
                 await self._notify("completed", source_filename)
             else:
                 stderr = ""
-                if process.stderr:
-                    stderr_bytes = await process.stderr.read()
-                    stderr = stderr_bytes.decode()[-500:]  # Last 500 chars
+                if stderr_task:
+                    stderr = (await stderr_task).decode(errors="replace")
                 self.update_job_status(
                     job_id,
                     "failed",
@@ -447,6 +752,12 @@ class TranscodeManager:
         except Exception as e:
             self.update_job_status(job_id, "failed", error_message=str(e))
             await self._notify("failed", source_filename)
+        finally:
+            # Clean up, the stderr reader is still running if we bailed early
+            if stderr_task:
+                stderr_task.cancel()
+            self._active_processes.pop(job_id, None)
+            self._progress_scales.pop(job_id, None)
 
     def process_queue(self) -> None:
         """Start pending jobs if capacity available (called from sync context)."""
@@ -456,22 +767,40 @@ class TranscodeManager:
 
     async def process_queue_async(self) -> None:
         """Start pending jobs if capacity available."""
-        max_parallel = get_config().get("transcoding.max_parallel_jobs", 5)
-        in_progress = self.get_in_progress_count()
+        max_parallel = self._max_parallel_jobs
+        # One query for both the running count and the queue
+        active = self.get_active_jobs()
+        in_progress = sum(1 for job in active if job["status"] == "in_progress")
 
         if in_progress >= max_parallel:
             return
 
         # Start as many jobs as we have capacity for
-        pending = self.get_pending_jobs()
         jobs_to_start = max_parallel - in_progress
+        pending = active[in_progress:]
 
         for job in pending[:jobs_to_start]:
             # Don't await - let it run in background
             asyncio.create_task(self.start_job_async(job["id"], job))
 
 
-def _dict_factory(cursor: Any, row: tuple[Any, ...]) -> dict[str, Any]:
-    """Convert sqlite row to dict."""
+def _parse_probe(data: dict[str, Any]) -> VideoProbe:
+    """Pick duration, first video and first audio stream from ffprobe json."""
+    probe = VideoProbe(duration=None, video_codec=None, height=None, audio_codec=None)
+    with suppress(KeyError, TypeError, ValueError):
+        probe["duration"] = float(data["format"]["duration"])
+
+    for stream in data.get("streams", []):
+        codec_type = stream.get("codec_type")
+        if codec_type == "video" and probe["video_codec"] is None:
+            probe["video_codec"] = stream.get("codec_name")
+            probe["height"] = stream.get("height")
+        elif codec_type == "audio" and probe["audio_codec"] is None:
+            probe["audio_codec"] = stream.get("codec_name")
+    return probe
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> list[Any]:
+    """Fetch all remaining rows as dicts, resolving column names once."""
     fields = [column[0] for column in cursor.description]
-    return dict(zip(fields, row))
+    return [dict(zip(fields, row)) for row in cursor.fetchall()]
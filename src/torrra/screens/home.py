@@ -1,15 +1,20 @@
+import asyncio
+
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
+from textual.notifications import SeverityLevel
 from textual.screen import Screen
 from textual.widgets import ContentSwitcher
 from typing_extensions import override
 
-from torrra._types import Indexer, TorrentStatus
+from torrra._types import Indexer
 from torrra.core.config import get_config
 from torrra.core.download import get_download_manager
 from torrra.core.torrent import get_torrent_manager
+from torrra.core.transcoder import get_transcode_manager
+from torrra.utils.direct_download import handle_direct_download
 from torrra.widgets.downloads import DownloadsContent
 from torrra.widgets.search import SearchContent
 from torrra.widgets.sidebar import Sidebar
@@ -20,6 +25,21 @@ class HomeScreen(Screen[None]):
     BINDINGS = [
         Binding("ctrl+s", "open_search", "Search", show=True),
     ]
+    # transcoding event -> (message template, title, severity)
+    _TRANSCODE_NOTIFICATIONS: dict[str, tuple[str, str, SeverityLevel]] = {
+        "started": (
+            "Started transcoding [b]{}[/b]",
+            "Transcoding Started",
+            "information",
+        ),
+        "completed": (
+            "Finished transcoding [b]{}[/b]",
+            "Transcoding Finished",
+            "information",
+        ),
+        "failed": ("Failed to transcode [b]{}[/b]", "Transcoding Failed", "error"),
+    }
+
     def __init__(
         self,
         indexer: Indexer,
@@ -39,6 +59,13 @@ class HomeScreen(Screen[None]):
         self._search_content: SearchContent
         self._transcoding_content: TranscodingContent
 
+        # guards so a slow tick never overlaps with the next one
+        self._downloads_tick_running: bool = False
+        self._transcoding_tick_running: bool = False
+        # last counts pushed to the sidebar, relabel only when they change
+        self._last_download_counts: dict[str, int] = {}
+        self._last_transcoding_counts: dict[str, int] = {}
+
     @override
     def compose(self) -> ComposeResult:
         initial_content = (
@@ -76,24 +103,20 @@ class HomeScreen(Screen[None]):
 
         # Handle direct download if provided
         if self.direct_download:
-            import asyncio
-            from torrra.utils.direct_download import handle_direct_download
-
             asyncio.create_task(handle_direct_download(self, str(self.direct_download)))
             # start_direct_download(self, str(self.direct_download))
 
         # start timer to update data on both sidebar
-        # and downloads content table
-        self.set_interval(1, self._update_downloads_data)
+        # and downloads content table. each tick schedules the next one
+        # once it is done, so slow ticks delay rather than pile up
+        self.set_timer(1, self._tick_downloads)
         # start timer for transcoding updates (every 2 seconds)
-        self.set_interval(2, self._update_transcoding_data)
+        self.set_timer(2, self._tick_transcoding)
         # periodically save resume data (every 30 seconds)
         self.set_interval(30, self._save_resume_data)
 
         # Set up transcoding notifications
         if get_config().get("transcoding.enabled", False):
-            from torrra.core.transcoder import get_transcode_manager
-
             get_transcode_manager().set_notification_callback(
                 self._on_transcode_notification
             )
@@ -106,11 +129,11 @@ class HomeScreen(Screen[None]):
         get_download_manager().save_all_resume_data()
 
     def on_sidebar_item_selected(self, event: Sidebar.ItemSelected) -> None:
-        self.query_one(ContentSwitcher).current = event.group_id
+        self._content_switcher.current = event.group_id
 
     def on_search_content_download_requested(self) -> None:
-        self.query_one(ContentSwitcher).current = "downloads_content"
-        self.query_one(Sidebar).select_node_by_group_id("downloads_content")
+        self._content_switcher.current = "downloads_content"
+        self._sidebar.select_node_by_group_id("downloads_content")
 
         self._downloads_content.focus_table()
 
@@ -120,85 +143,114 @@ class HomeScreen(Screen[None]):
         self._sidebar.select_node_by_group_id("search_content")
         self._search_content.focus_search_input()
 
+    def _tick_downloads(self) -> None:
+        if self._downloads_tick_running:
+            return
+
+        self._downloads_tick_running = True
+        try:
+            self._update_downloads_data()
+        finally:
+            self._downloads_tick_running = False
+            if self.is_attached:
+                self.set_timer(1, self._tick_downloads)
+
+    async def _tick_transcoding(self) -> None:
+        if self._transcoding_tick_running:
+            return
+
+        self._transcoding_tick_running = True
+        try:
+            await self._update_transcoding_data()
+        finally:
+            self._transcoding_tick_running = False
+            if self.is_attached:
+                self.set_timer(2, self._tick_transcoding)
+
     def _update_downloads_data(self) -> None:
         dm = get_download_manager()
 
+        # Apply the latest batched status updates from libtorrent
+        dm.update_statuses()
+
         # Check for metadata updates
-        dm.check_metadata_updates()
+        metadata_updated = dm.check_metadata_updates()
 
         # Enforce seeding policy (pause seeding torrents if disabled)
         dm.enforce_seeding_policy()
 
-        magnet_uris = list(dm.torrents.keys())
+        counts = self._collect_download_counts()
+        if counts != self._last_download_counts:
+            self._sidebar.update_download_counts(counts)
+            self._last_download_counts = counts
 
-        counts = {"Downloading": 0, "Seeding": 0, "Paused": 0, "Completed": 0}
-        statuses: dict[str, TorrentStatus | None] = {}
+        # only update downloads table if it is visible
+        if self._content_switcher.current == "downloads_content":
+            self._refresh_downloads_table(metadata_updated)
 
-        for uri in magnet_uris:
-            status = dm.get_torrent_status(uri)
-            statuses[uri] = status
-            if not status:
-                continue
+    def _collect_download_counts(self) -> dict[str, int]:
+        dm = get_download_manager()
 
-            state_text = dm.get_torrent_state_text(status)
-            if state_text in ("Downloading", "Fetching"):
-                counts["Downloading"] += 1
-            elif state_text in counts:
-                counts[state_text] += 1
+        # cached statuses fed by libtorrent alerts, no per-torrent status() call
+        downloading = seeding = paused = completed = 0
+        state_text = dm.get_torrent_state_text
+        for status in dm.get_all_torrent_statuses().values():
+            text = state_text(status)
+            if text == "Downloading" or text == "Fetching":
+                downloading += 1
+            elif text == "Seeding":
+                seeding += 1
+            elif text == "Paused":
+                paused += 1
+            elif text == "Completed":
+                completed += 1
+        return {
+            "Downloading": downloading,
+            "Seeding": seeding,
+            "Paused": paused,
+            "Completed": completed,
+        }
 
-        self._sidebar.update_download_counts(counts)
-        # only update downloads table if it is visible
-        if self._content_switcher.current == "downloads_content":
-            self._downloads_content.update_table_data(statuses)
+    def _refresh_downloads_table(self, metadata_updated: bool) -> None:
+        statuses = get_download_manager().get_all_torrent_statuses()
+        self._downloads_content.update_table_data(statuses, metadata_updated)
 
     def _on_transcode_notification(self, event: str, filename: str) -> None:
         """Handle transcoding notifications."""
-        short_name = (filename[:40] + "...") if len(filename) > 40 else filename
+        notification = self._TRANSCODE_NOTIFICATIONS.get(event)
+        if not notification:
+            return
 
-        if event == "started":
-            self.notify(
-                f"Started transcoding [b]{short_name}[/b]",
-                title="Transcoding Started",
-            )
-        elif event == "completed":
-            self.notify(
-                f"Finished transcoding [b]{short_name}[/b]",
-                title="Transcoding Finished",
-            )
-        elif event == "failed":
-            self.notify(
-                f"Failed to transcode [b]{short_name}[/b]",
-                title="Transcoding Failed",
-                severity="error",
-            )
+        template, title, severity = notification
+        short_name = filename if len(filename) <= 40 else f"{filename[:40]}..."
+        self.notify(template.format(short_name), title=title, severity=severity)
 
     async def _update_transcoding_data(self) -> None:
         """Process transcoding queue and update UI."""
         if not get_config().get("transcoding.enabled", False):
             return
 
-        from torrra.core.transcoder import get_transcode_manager
-
         tm = get_transcode_manager()
 
         # Process pending jobs (start new ones if capacity)
         await tm.process_queue_async()
 
         # Update sidebar counts
-        jobs = tm.get_all_jobs()
-        counts = {"Pending": 0, "In Progress": 0, "Completed": 0, "Failed": 0}
-        status_map = {
-            "pending": "Pending",
-            "in_progress": "In Progress",
-            "completed": "Completed",
-            "failed": "Failed",
-        }
-        for job in jobs:
-            status_key = status_map.get(job["status"])
-            if status_key:
-                counts[status_key] += 1
-        self._sidebar.update_transcoding_counts(counts)
+        counts = self._collect_transcoding_counts()
+        if counts != self._last_transcoding_counts:
+            self._sidebar.update_transcoding_counts(counts)
+            self._last_transcoding_counts = counts
 
         # Update UI if transcoding content is visible
         if self._content_switcher.current == "transcoding_content":
-            self._transcoding_content.update_table_data()
+            await self._transcoding_content.update_table_data()
+
+    def _collect_transcoding_counts(self) -> dict[str, int]:
+        # one grouped count query instead of loading every job row
+        status_counts = get_transcode_manager().get_status_counts()
+        return {
+            "Pending": status_counts.get("pending", 0),
+            "In Progress": status_counts.get("in_progress", 0),
+            "Completed": status_counts.get("completed", 0),
+            "Failed": status_counts.get("failed", 0),
+        }
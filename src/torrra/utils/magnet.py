@@ -5,11 +5,27 @@ from contextlib import suppress
 import httpx
 import libtorrent as lt
 
+# successful .torrent url resolutions, oldest evicted first
+_RESOLVED_CACHE_SIZE = 512
+_resolved_uris: dict[str, str] = {}
+
 
 async def resolve_magnet_uri(input_uri: str) -> str | None:
     if input_uri.startswith("magnet:"):
         return input_uri
 
+    if resolved := _resolved_uris.get(input_uri):
+        return resolved
+
+    magnet_uri = await _resolve_remote_uri(input_uri)
+    if magnet_uri:
+        if len(_resolved_uris) >= _RESOLVED_CACHE_SIZE:
+            del _resolved_uris[next(iter(_resolved_uris))]
+        _resolved_uris[input_uri] = magnet_uri
+    return magnet_uri
+
+
+async def _resolve_remote_uri(input_uri: str) -> str | None:
     try:
         # some torrent doesnt have magnet uri, instead a uri to .torrent file
         # send request to that uri and parse content
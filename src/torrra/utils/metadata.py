@@ -4,8 +4,14 @@ from dataclasses import dataclass
 
 import libtorrent as lt
 
+from torrra.core.cache import cache
 from torrra.utils.magnet import resolve_magnet_uri
 
+# caps in-flight metadata fetches sharing the download session's DHT
+_METADATA_SEM = asyncio.BoundedSemaphore(8)
+# metadata fetches in progress per info-hash
+_inflight: dict[str, "asyncio.Future[list[TorrentFile] | None]"] = {}
+
 
 @dataclass
 class TorrentFile:
@@ -16,7 +22,7 @@ class TorrentFile:
 
 
 async def fetch_torrent_files(
-    raw_uri: str, timeout: float = 30.0
+    raw_uri: str, timeout: float = 30.0, use_cache: bool = True
 ) -> list[TorrentFile] | None:
     """
     Fetch the list of files in a torrent from its magnet URI or .torrent URL.
@@ -27,6 +33,7 @@ async def fetch_torrent_files(
     Args:
         raw_uri: The magnet URI or .torrent URL
         timeout: Maximum time to wait for metadata (seconds)
+        use_cache: Read and store file lists in the disk cache
 
     Returns:
         List of TorrentFile objects, or None if metadata couldn't be fetched
@@ -39,45 +46,90 @@ async def fetch_torrent_files(
     from torrra.core.download import get_download_manager
 
     dm = get_download_manager()
-    session = dm.session
 
     # Check if torrent is already in the session (being downloaded)
     existing_handle = dm.torrents.get(magnet_uri)
     if existing_handle and existing_handle.is_valid() and existing_handle.has_metadata():
         return _extract_files(existing_handle)
 
-    handle = None
     try:
-        # Parse and add the torrent temporarily
         atp = lt.parse_magnet_uri(magnet_uri)
-        atp.save_path = tempfile.gettempdir()
-        atp.flags |= lt.torrent_flags.upload_mode  # Don't download, just get metadata
-
-        handle = session.add_torrent(atp)
-
-        # Wait for metadata with timeout
-        elapsed = 0.0
-        poll_interval = 0.5
-        while elapsed < timeout:
-            if handle.has_metadata():
-                break
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-        else:
-            # Timeout reached
+    except Exception:
+        return None
+
+    # file lists never change for an info-hash, reuse them across sessions
+    info_hash = str(atp.info_hashes.get_best())
+    files_key = cache.make_key("files", info_hash) if use_cache else None
+    if files_key and (cached := cache.get(files_key)) is not None:
+        return [TorrentFile(path=path, size=size) for path, size in cached]
+
+    # callers asking for the same torrent share one fetch
+    fetch = _inflight.get(info_hash)
+    if fetch is None:
+        fetch = asyncio.ensure_future(
+            _fetch_from_session(magnet_uri, atp, files_key, timeout)
+        )
+        _inflight[info_hash] = fetch
+        fetch.add_done_callback(lambda _: _inflight.pop(info_hash, None))
+
+    # a cancelled caller must not cancel the fetch for the others
+    return await asyncio.shield(fetch)
+
+
+async def _fetch_from_session(
+    magnet_uri: str,
+    atp: lt.add_torrent_params,
+    files_key: str | None,
+    timeout: float,
+) -> list[TorrentFile] | None:
+    """Add the torrent temporarily to the session until its metadata arrives."""
+    from torrra.core.download import get_download_manager
+
+    dm = get_download_manager()
+    session = dm.session
+
+    # slot held for the whole add/wait/remove of the temporary torrent
+    async with _METADATA_SEM:
+        handle = None
+        try:
+            atp.save_path = tempfile.gettempdir()
+            # Don't download, just get metadata. Unmanaged so the session's
+            # queueing can't hold the fetch back, which means nothing clears
+            # the paused bit parse_magnet_uri sets, so drop it here. No
+            # stop_when_ready: a magnet is "ready" before its metadata arrives
+            atp.flags = (atp.flags | lt.torrent_flags.upload_mode) & ~(
+                lt.torrent_flags.auto_managed | lt.torrent_flags.paused
+            )
+
+            handle = session.add_torrent(atp)
+
+            # Wait for metadata_received_alert with timeout
+            if not await dm.wait_for_metadata(handle, timeout):
+                return None
+
+            files = _extract_files(handle)
+            if files is not None and files_key:
+                cache.set(files_key, [(f.path, f.size) for f in files])
+            return files
+
+        except Exception:
             return None
+        finally:
+            # Clean up: remove the temporary torrent (only if we added it)
+            if handle is not None and magnet_uri not in dm.torrents:
+                try:
+                    session.remove_torrent(handle, lt.session.delete_files)
+                except Exception:
+                    pass
 
-        return _extract_files(handle)
 
-    except Exception:
-        return None
-    finally:
-        # Clean up: remove the temporary torrent (only if we added it)
-        if handle is not None and magnet_uri not in dm.torrents:
-            try:
-                session.remove_torrent(handle, lt.session.delete_files)
-            except Exception:
-                pass
+async def fetch_torrent_files_many(
+    raw_uris: list[str], timeout: float = 30.0, use_cache: bool = True
+) -> list[list[TorrentFile] | None]:
+    """Fetch file lists for several torrents concurrently, in input order."""
+    return await asyncio.gather(
+        *(fetch_torrent_files(raw_uri, timeout, use_cache) for raw_uri in raw_uris)
+    )
 
 
 def _extract_files(handle: lt.torrent_handle) -> list[TorrentFile] | None:
@@ -86,13 +138,11 @@ def _extract_files(handle: lt.torrent_handle) -> list[TorrentFile] | None:
     if not torrent_info:
         return None
 
-    files = []
+    # bind the accessors once, season packs can hold tens of thousands of files
     file_storage = torrent_info.files()
-    for i in range(file_storage.num_files()):
-        files.append(
-            TorrentFile(
-                path=file_storage.file_path(i),
-                size=file_storage.file_size(i),
-            )
-        )
-    return files
+    file_path = file_storage.file_path
+    file_size = file_storage.file_size
+    return [
+        TorrentFile(path=file_path(i), size=file_size(i))
+        for i in range(file_storage.num_files())
+    ]
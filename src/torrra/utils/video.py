@@ -1,6 +1,8 @@
 """Video file utilities."""
 
 import re
+from functools import lru_cache
+from typing import Any
 
 # Common video file extensions
 VIDEO_EXTENSIONS = {
@@ -18,7 +20,31 @@ VIDEO_EXTENSIONS = {
     ".m2ts",
 }
 
+# One alternation for all extensions, matched at the end of the title or
+# before whitespace and closing brackets. Longest first so ".mpeg" is tried
+# before ".mpg" and friends.
+_VIDEO_EXT_RE = re.compile(
+    "("
+    + "|".join(
+        re.escape(ext) for ext in sorted(VIDEO_EXTENSIONS, key=len, reverse=True)
+    )
+    + r")(?:[\s\]\)]|$)"
+)
 
+# Normalized input extensions of the transcoding rules, rebuilt whenever the
+# configured rules list is replaced
+_transcodable_exts: frozenset[str] = frozenset()
+_transcodable_source: list[dict[str, Any]] | None = None
+
+
+def _normalize_extension(extension: str) -> str:
+    ext_lower = extension.lower()
+    if not ext_lower.startswith("."):
+        ext_lower = f".{ext_lower}"
+    return ext_lower
+
+
+@lru_cache(maxsize=1024)  # search rows get re-selected while navigating
 def detect_video_extension(title: str) -> str | None:
     """Detect video file extension from a torrent title.
 
@@ -28,17 +54,8 @@ def detect_video_extension(title: str) -> str | None:
     # Look for extension patterns in the title
     # Common patterns: "Movie.Name.2024.1080p.BluRay.x264.mkv"
     # or "Movie Name (2024) [1080p].mkv"
-    title_lower = title.lower()
-
-    for ext in VIDEO_EXTENSIONS:
-        # Check if title ends with extension
-        if title_lower.endswith(ext):
-            return ext
-        # Check for extension followed by common suffixes or brackets
-        pattern = rf"{re.escape(ext)}[\s\]\)]"
-        if re.search(pattern, title_lower):
-            return ext
-
+    if match := _VIDEO_EXT_RE.search(title.lower()):
+        return match.group(1)
     return None
 
 
@@ -53,15 +70,11 @@ def is_transcodable_extension(extension: str) -> bool:
     if not isinstance(rules, list):
         return False
 
-    ext_lower = extension.lower()
-    if not ext_lower.startswith("."):
-        ext_lower = f".{ext_lower}"
-
-    for rule in rules:
-        rule_ext = rule.get("input_extension", "").lower()
-        if not rule_ext.startswith("."):
-            rule_ext = f".{rule_ext}"
-        if ext_lower == rule_ext:
-            return True
+    global _transcodable_exts, _transcodable_source
+    if _transcodable_source is not rules:
+        _transcodable_exts = frozenset(
+            _normalize_extension(rule.get("input_extension", "")) for rule in rules
+        )
+        _transcodable_source = rules
 
-    return False
+    return _normalize_extension(extension) in _transcodable_exts
@@ -23,11 +23,16 @@ class DownloadsContent(Vertical):
         ("Up", "up_speed", 6),
         ("Down", "down_speed", 6),
     ]
+    # columns filled from the torrent status, in update_table_data cell order
+    _STATUS_COLS: tuple[str, ...] = ("status", "done_percent", "up_speed", "down_speed")
 
     def __init__(self) -> None:
         super().__init__(id="downloads_content")
         self._torrents: list[TorrentRecord] = []
         self._selected_torrent: TorrentRecord | None = None
+        # what the table currently shows, to skip unchanged rows and cells
+        self._last_statuses: dict[str, TorrentStatus] | None = None
+        self._rendered_cells: dict[str, tuple[str, str, str, str]] = {}
 
         self._dm: DownloadManager = get_download_manager()
         self._tm: TorrentManager = get_torrent_manager()
@@ -55,6 +60,8 @@ class DownloadsContent(Vertical):
 
         self._table.clear()
         self._table.border_title = f"all ({len(self._torrents)})"
+        self._last_statuses = None
+        self._rendered_cells = {}
 
         for idx, torrent in enumerate(self._torrents):
             self._dm.add_torrent(torrent["magnet_uri"], is_paused=torrent["is_paused"])
@@ -217,13 +224,23 @@ class DownloadsContent(Vertical):
     def focus_table(self) -> None:
         self._table.focus()
 
-    def update_table_data(self, statuses: dict[str, TorrentStatus | None]) -> None:
+    def update_table_data(
+        self, statuses: dict[str, TorrentStatus], metadata_updated: bool = True
+    ) -> None:
         if not self._torrents:
             return
 
+        # statuses are swapped, never mutated, on update: same dict, same data
+        previous = self._last_statuses
+        if statuses is previous and not metadata_updated:
+            return
+        self._last_statuses = statuses
+
         # First, update the torrent list from the database to catch metadata updates
-        updated_torrents = self._tm.get_all_torrents()
-        torrent_map = {t["magnet_uri"]: t for t in updated_torrents}
+        torrent_map: dict[str, TorrentRecord] = {}
+        if metadata_updated:
+            updated_torrents = self._tm.get_all_torrents()
+            torrent_map = {t["magnet_uri"]: t for t in updated_torrents}
 
         for torrent in self._torrents:
             # Update the local torrent record if it was updated in the database
@@ -245,27 +262,22 @@ class DownloadsContent(Vertical):
             status = statuses.get(torrent["magnet_uri"])
             if not status:
                 continue
+            # untouched since the last refresh, nothing to redraw
+            if previous is not None and previous.get(torrent["magnet_uri"]) is status:
+                continue
 
-            self._table.update_cell(
-                torrent["magnet_uri"],
-                "status",
+            cells = (
                 self._dm.get_torrent_state_text(status, short=True),
-            )
-            self._table.update_cell(
-                torrent["magnet_uri"],
-                "done_percent",
                 f"{int(status['progress'])}%",
-            )
-            self._table.update_cell(
-                torrent["magnet_uri"],
-                "up_speed",
                 f"{human_readable_size(status['up_speed'], short=True)}/s",
-            )
-            self._table.update_cell(
-                torrent["magnet_uri"],
-                "down_speed",
                 f"{human_readable_size(status['down_speed'], short=True)}/s",
             )
+            rendered = self._rendered_cells.get(torrent["magnet_uri"])
+            if cells != rendered:
+                for idx, key in enumerate(self._STATUS_COLS):
+                    if rendered is None or cells[idx] != rendered[idx]:
+                        self._table.update_cell(torrent["magnet_uri"], key, cells[idx])
+                self._rendered_cells[torrent["magnet_uri"]] = cells
 
             # check if torrent is already downloaded/notified
             # if not, send notification and update record
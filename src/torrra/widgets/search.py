@@ -1,5 +1,6 @@
 import subprocess
 from enum import Enum
+from operator import attrgetter
 from typing import cast
 
 from textual import on, work
@@ -22,6 +23,9 @@ from torrra.widgets.data_table import AutoResizingDataTable
 from torrra.widgets.details_panel import DetailsPanel
 from torrra.widgets.spinner import Spinner
 
+# indexer name -> resolved indexer class
+_INDEXER_CLS_CACHE: dict[str, type[BaseIndexer]] = {}
+
 
 class SortMode(Enum):
     RELEVANCY = "relevancy"
@@ -35,6 +39,7 @@ class SearchContent(Vertical):
         ("Size", "size_col", 10),
         ("S:L", "seeders_leechers_col", 6),
     ]
+    _SEEDERS_KEY = attrgetter("seeders")
 
     class SearchResults(Message):
         def __init__(self, results: list[Torrent], query: str) -> None:
@@ -59,6 +64,11 @@ class SearchContent(Vertical):
         # application states
         self._search_results_map: dict[str, Torrent] = {}
         self._search_results_list: list[Torrent] = []  # original order from indexer
+        # both sort orders, computed once per result set
+        self._sorted_results: dict[SortMode, list[Torrent]] = {}
+        # formatted size and S:L cells, results don't change once received
+        self._size_strs: dict[str, str] = {}
+        self._sl_strs: dict[str, str] = {}
         self._selected_torrent: Torrent | None = None
         self._sort_mode: SortMode = SortMode.RELEVANCY
 
@@ -115,33 +125,24 @@ class SearchContent(Vertical):
 
     def _get_sorted_results(self) -> list[Torrent]:
         """Return results sorted according to current sort mode."""
-        if self._sort_mode == SortMode.SEEDERS:
-            return sorted(
-                self._search_results_list,
-                key=lambda t: t.seeders,
-                reverse=True,
-            )
-        # RELEVANCY: return original order
-        return list(self._search_results_list)
+        return self._sorted_results.get(self._sort_mode, self._search_results_list)
 
     def _refresh_table(self) -> None:
         """Refresh the table with current sort mode."""
-        self._table.clear()
         sorted_results = self._get_sorted_results()
 
-        seen: set[str] = set()
-        for idx, torrent in enumerate(sorted_results):
-            if torrent.magnet_uri in seen:
-                continue
-
-            seen.add(torrent.magnet_uri)
-            self._table.add_row(
-                str(idx + 1),
-                torrent.title,
-                human_readable_size(torrent.size),
-                f"{str(torrent.seeders)}:{str(torrent.leechers)}",
-                key=torrent.magnet_uri,
-            )
+        # one repaint for the whole rebuild instead of one per row
+        with self.app.batch_update():
+            self._table.clear()
+            # results are deduplicated on arrival, see _perform_search
+            for idx, torrent in enumerate(sorted_results):
+                self._table.add_row(
+                    str(idx + 1),
+                    torrent.title,
+                    self._size_strs[torrent.magnet_uri],
+                    self._sl_strs[torrent.magnet_uri],
+                    key=torrent.magnet_uri,
+                )
 
         # Update border title to show sort mode
         sort_label = "seeders" if self._sort_mode == SortMode.SEEDERS else "relevancy"
@@ -224,7 +225,12 @@ class SearchContent(Vertical):
         try:
             indexer = self._get_indexer_instance()
             results = await indexer.search(query, use_cache=self.use_cache)
-            self.post_message(self.SearchResults(results or [], query))
+
+            # drop duplicate magnets once here instead of on every table refresh
+            unique: dict[str, Torrent] = {}
+            for torrent in results or []:
+                unique.setdefault(torrent.magnet_uri, torrent)
+            self.post_message(self.SearchResults(list(unique.values()), query))
         except Exception:
             self.notify(
                 "Search failed, check indexer settings",
@@ -249,6 +255,18 @@ class SearchContent(Vertical):
         # Store results and build lookup map
         self._search_results_list = message.results
         self._search_results_map = {t.magnet_uri: t for t in message.results}
+        self._sorted_results = {
+            SortMode.RELEVANCY: message.results,  # original order
+            SortMode.SEEDERS: sorted(
+                message.results, key=self._SEEDERS_KEY, reverse=True
+            ),
+        }
+        self._size_strs = {
+            t.magnet_uri: human_readable_size(t.size) for t in message.results
+        }
+        self._sl_strs = {
+            t.magnet_uri: f"{t.seeders}:{t.leechers}" for t in message.results
+        }
 
         # Reset to default sort mode on new search
         self._sort_mode = SortMode.RELEVANCY
@@ -280,7 +298,7 @@ class SearchContent(Vertical):
 
         details = f"""
 [b]{self._selected_torrent.title}[/b]
-[b]Size:[/b] {human_readable_size(self._selected_torrent.size)} - [b]Seeders:[/b] {self._selected_torrent.seeders} - [b]Leechers:[/b] {self._selected_torrent.leechers} - [b]Source:[/b] {self._selected_torrent.source}{format_info}
+[b]Size:[/b] {self._size_strs[magnet_uri]} - [b]Seeders:[/b] {self._selected_torrent.seeders} - [b]Leechers:[/b] {self._selected_torrent.leechers} - [b]Source:[/b] {self._selected_torrent.source}{format_info}
 
 [dim]Press 'enter' to download or 'esc' to close.[/dim]
 """
@@ -310,12 +328,16 @@ class SearchContent(Vertical):
         self._search_input.focus()
 
     def _get_indexer_instance(self) -> BaseIndexer:
+        if self._indexer_instance_cache is not None:
+            return self._indexer_instance_cache
 
         name = self.indexer.name
-        indexer_cls_str = f"torrra.indexers.{name}.{name.title()}Indexer"
+        indexer_cls = _INDEXER_CLS_CACHE.get(name)
+        if indexer_cls is None:
+            indexer_cls = lazy_import(f"torrra.indexers.{name}.{name.title()}Indexer")
+            assert issubclass(indexer_cls, BaseIndexer)
+            _INDEXER_CLS_CACHE[name] = indexer_cls
 
-        indexer_cls = lazy_import(indexer_cls_str)
-        assert issubclass(indexer_cls, BaseIndexer)
         indexer_instance = indexer_cls(
             url=self.indexer.url,
             api_key=self.indexer.api_key,
@@ -331,7 +353,7 @@ class SearchContent(Vertical):
         """Fetch torrent metadata (file list) asynchronously."""
         self._metadata_fetch_in_progress.add(magnet_uri)
         try:
-            files = await fetch_torrent_files(magnet_uri)
+            files = await fetch_torrent_files(magnet_uri, use_cache=self.use_cache)
             self._metadata_cache[magnet_uri] = files
 
             # Update UI if this torrent is still selected
@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Callable
 from pathlib import Path
 from typing import cast
 
@@ -10,6 +12,14 @@ from torrra.widgets.data_table import AutoResizingDataTable
 from torrra.widgets.details_panel import DetailsPanel
 
 
+_DETAILS_FOOTER = "[dim]Press 'c' to cancel, 'd' to remove, or 'esc' to close.[/dim]"
+_ERROR_FMT = "[b]Error:[/b] [red]{}[/red]"
+
+
+def _no_progress(_progress: float) -> str:
+    return "-"
+
+
 class TranscodingContent(Vertical):
     COLS: list[tuple[str, str, int]] = [
         ("No", "no_col", 2),
@@ -19,6 +29,17 @@ class TranscodingContent(Vertical):
         ("Progress", "progress", 8),
     ]
 
+    # progress column per status, the rest show _no_progress
+    _PROGRESS_BY_STATUS: dict[str, Callable[[float], str]] = {
+        "in_progress": lambda progress: f"{int(progress)}%",
+        "completed": lambda _progress: "100%",
+    }
+
+    # columns that change after a row was added, in _rendered order
+    _DYNAMIC_COLS: tuple[str, str, str] = ("no_col", "status", "progress")
+
+    ACTIVE_STATUSES: frozenset[str] = frozenset({"pending", "in_progress"})
+
     STATUS_DISPLAY = {
         "pending": "Pending",
         "in_progress": "Running",
@@ -30,7 +51,21 @@ class TranscodingContent(Vertical):
     def __init__(self) -> None:
         super().__init__(id="transcoding_content")
         self._jobs: list[TranscodeJob] = []
+        self._jobs_by_id: dict[int, TranscodeJob] = {}
         self._selected_job: TranscodeJob | None = None
+        # (no, status, progress) cells as last written to the table, by job id
+        self._rendered: dict[int, tuple[str, str, str]] = {}
+        self._row_keys: set[str] = set()
+        # (source name, output column) per job id, fixed once a job is queued
+        self._job_labels: dict[int, tuple[str, str]] = {}
+        # pending/in-progress jobs, the only ones that still change
+        self._active_ids: set[int] = set()
+        # newest updated_at seen, polls only fetch rows written since
+        self._last_poll_ts: float = 0.0
+        # (details, progress) last handed to the details panel
+        self._details_content: tuple[str, float] | None = None
+        # (status, whole percent, error) of the selected job as last polled
+        self._details_sig: tuple[str, int, str | None] | None = None
 
         self._tm: TranscodeManager = get_transcode_manager()
 
@@ -54,50 +89,108 @@ class TranscodingContent(Vertical):
             self._table.add_column(label, width=width, key=key)
 
     def on_show(self) -> None:
-        self._refresh_jobs()
-
-    def _refresh_jobs(self) -> None:
-        """Refresh the jobs list from database."""
-        self._jobs = self._tm.get_all_jobs()
-        self._table.clear()
-        self._table.border_title = f"transcoding ({len(self._jobs)})"
-
-        for idx, job in enumerate(self._jobs):
-            source_name = Path(job["source_file"]).name
-            output_format = Path(job["destination_file"] or "").suffix.lstrip(".")
-
-            # Get resolution from matching rule
-            rule = self._tm.get_matching_rule(job["source_file"])
-            resolution = rule.get("resolution", "original") if rule else "original"
-            if resolution != "original":
-                output_display = f"{output_format.upper()}, {resolution.upper()}"
-            else:
-                output_display = output_format.upper()
-
-            status_display = self.STATUS_DISPLAY.get(job["status"], job["status"])
-            progress = (
-                f"{int(job['progress'])}%" if job["status"] == "in_progress" else "-"
-            )
+        self._reload_jobs()
+
+    def _reload_jobs(self) -> None:
+        """Refresh in the background, a newer refresh supersedes a pending one."""
+        self.run_worker(self._refresh_jobs(), group="refresh_jobs", exclusive=True)
+
+    async def _refresh_jobs(self) -> None:
+        """Sync the table with the jobs in the database, reusing existing rows."""
+        # read off the event loop, the table is only touched after the await
+        self._jobs = await asyncio.to_thread(self._tm.get_all_jobs)
+        self._jobs_by_id = {job["id"]: job for job in self._jobs}
+        self._last_poll_ts = max((job["updated_at"] for job in self._jobs), default=0.0)
+        self._active_ids = {
+            job["id"] for job in self._jobs if job["status"] in self.ACTIVE_STATUSES
+        }
+        new_keys = {str(job["id"]) for job in self._jobs}
+
+        # one repaint for the whole sync instead of one per row
+        with self.app.batch_update():
+            for key in self._row_keys - new_keys:
+                self._table.remove_row(key)
+                self._rendered.pop(int(key), None)
+                self._job_labels.pop(int(key), None)
+
+            reorder = False
+            for idx, job in enumerate(self._jobs):
+                if str(job["id"]) in self._row_keys:
+                    reorder |= self._update_row(job, str(idx + 1))
+                else:
+                    self._add_row(job, str(idx + 1))
+                    reorder = True
+
+            # new jobs are appended at the bottom, put rows back in job order
+            if reorder:
+                self._table.sort("no_col", key=int)
+            self._row_keys = new_keys
+            self._table.border_title = f"transcoding ({len(self._jobs)})"
+
+        if not self._jobs:
+            self._selected_job = None
+            self._details_panel.add_class("hidden")
+            return
 
-            if job["status"] == "completed":
-                progress = "100%"
+        # keep the selection on the same job if it is still listed
+        selected_id = self._selected_job["id"] if self._selected_job else -1
+        self._selected_job = self._jobs_by_id.get(selected_id, self._jobs[0])
+        self._table.move_cursor(
+            row=self._table.get_row_index(str(self._selected_job["id"]))
+        )
+        self._details_sig = None
+        self._update_details_panel(self._selected_job)
+        self._details_panel.remove_class("hidden")
+
+    def _status_cells(self, job: TranscodeJob) -> tuple[str, str]:
+        status = job["status"]
+        progress = self._PROGRESS_BY_STATUS.get(status, _no_progress)(job["progress"])
+        return self.STATUS_DISPLAY.get(status, status), progress
+
+    def _get_labels(self, job: TranscodeJob) -> tuple[str, str]:
+        """Get the (source name, output column) of a job, computed once."""
+        if labels := self._job_labels.get(job["id"]):
+            return labels
+
+        source_name = Path(job["source_file"]).name
+        output_format = Path(job["destination_file"] or "").suffix.lstrip(".")
+
+        # Get resolution from matching rule
+        rule = self._tm.get_matching_rule(job["source_file"])
+        resolution = rule.get("resolution", "original") if rule else "original"
+        if resolution != "original":
+            output_display = f"{output_format.upper()}, {resolution.upper()}"
+        else:
+            output_display = output_format.upper()
+
+        self._job_labels[job["id"]] = (source_name, output_display)
+        return source_name, output_display
+
+    def _add_row(self, job: TranscodeJob, number: str) -> None:
+        source_name, output_display = self._get_labels(job)
+        status_display, progress = self._status_cells(job)
+        self._table.add_row(
+            number,
+            source_name,
+            output_display,
+            status_display,
+            progress,
+            key=str(job["id"]),
+        )
+        self._rendered[job["id"]] = (number, status_display, progress)
 
-            self._table.add_row(
-                str(idx + 1),
-                source_name,
-                output_display,
-                status_display,
-                progress,
-                key=str(job["id"]),
-            )
+    def _update_row(self, job: TranscodeJob, number: str | None = None) -> bool:
+        """Write the cells that changed since the last write, True if any did."""
+        rendered = self._rendered[job["id"]]
+        cells = (number or rendered[0], *self._status_cells(job))
+        if cells == rendered:
+            return False
 
-        # Show detail panel for the first item
-        if self._jobs:
-            self._selected_job = self._jobs[0]
-            self._update_details_panel(self._selected_job)
-            self._details_panel.remove_class("hidden")
-        else:
-            self._details_panel.add_class("hidden")
+        for column, value, old_value in zip(self._DYNAMIC_COLS, cells, rendered):
+            if value != old_value:
+                self._table.update_cell(str(job["id"]), column, value)
+        self._rendered[job["id"]] = cells
+        return cells[0] != rendered[0]
 
     def key_c(self) -> None:
         """Cancel selected job."""
@@ -108,10 +201,10 @@ class TranscodingContent(Vertical):
         if job["status"] in ("pending", "in_progress"):
             self._tm.cancel_job(job["id"])
             self.notify(
-                f"Cancelled transcoding of [b]{Path(job['source_file']).name}[/b]",
+                f"Cancelled transcoding of [b]{self._get_labels(job)[0]}[/b]",
                 title="Transcode Cancelled",
             )
-            self._refresh_jobs()
+            self._reload_jobs()
 
     def key_d(self) -> None:
         """Remove selected job from list."""
@@ -121,13 +214,14 @@ class TranscodingContent(Vertical):
         job = self._selected_job
         self._tm.remove_job(job["id"])
         self.notify(
-            f"Removed [b]{Path(job['source_file']).name}[/b] from list",
+            f"Removed [b]{self._get_labels(job)[0]}[/b] from list",
             title="Job Removed",
         )
-        self._refresh_jobs()
+        self._reload_jobs()
 
     def on_details_panel_closed(self) -> None:
         self._selected_job = None
+        self._details_sig = None
         self._table.focus()
 
     def on_data_table_row_highlighted(
@@ -136,7 +230,8 @@ class TranscodingContent(Vertical):
         """Update detail panel when cursor moves to a new row."""
         row_key = cast(str, event.row_key.value)
         job_id = int(row_key)
-        self._selected_job = next((j for j in self._jobs if j["id"] == job_id), None)
+        self._selected_job = self._jobs_by_id.get(job_id)
+        self._details_sig = None
 
         if self._selected_job:
             self._update_details_panel(self._selected_job)
@@ -150,7 +245,8 @@ class TranscodingContent(Vertical):
         """Focus the detail panel when a row is selected (clicked or 'l' pressed)."""
         row_key = cast(str, event.row_key.value)
         job_id = int(row_key)
-        self._selected_job = next((j for j in self._jobs if j["id"] == job_id), None)
+        self._selected_job = self._jobs_by_id.get(job_id)
+        self._details_sig = None
 
         if self._selected_job:
             self._update_details_panel(self._selected_job)
@@ -162,64 +258,71 @@ class TranscodingContent(Vertical):
     def focus_table(self) -> None:
         self._table.focus()
 
-    def update_table_data(self) -> None:
+    async def update_table_data(self) -> None:
         """Update the table with current job data."""
-        # Re-fetch jobs to get updated progress
-        updated_jobs = self._tm.get_all_jobs()
-        job_map = {j["id"]: j for j in updated_jobs}
-
         # Check if job count changed - if so, full refresh
-        if len(updated_jobs) != len(self._jobs):
-            self._refresh_jobs()
+        job_count = await asyncio.to_thread(self._tm.get_job_count)
+        if job_count != len(self._jobs):
+            await self._refresh_jobs()
             return
 
-        # Update existing rows
-        for job in self._jobs:
-            updated = job_map.get(job["id"])
-            if not updated:
-                continue
-
-            # Update local cache
-            job.update(updated)
-
-            status_display = self.STATUS_DISPLAY.get(job["status"], job["status"])
-            progress = (
-                f"{int(job['progress'])}%" if job["status"] == "in_progress" else "-"
-            )
-
-            if job["status"] == "completed":
-                progress = "100%"
-
-            self._table.update_cell(str(job["id"]), "status", status_display)
-            self._table.update_cell(str(job["id"]), "progress", progress)
+        if not self._active_ids:
+            return
 
-        # Update details panel if showing
-        if self._selected_job:
-            updated = job_map.get(self._selected_job["id"])
-            if updated:
-                self._selected_job.update(updated)
-                self._update_details_panel(self._selected_job)
+        # Fetch only rows written since the last poll
+        updated_jobs = await asyncio.to_thread(
+            self._tm.get_updated_jobs, self._last_poll_ts
+        )
+        if not updated_jobs:
+            return
+        self._last_poll_ts = max(job["updated_at"] for job in updated_jobs)
+        updated_ids = {job["id"] for job in updated_jobs}
+
+        with self.app.batch_update():
+            # Update existing rows
+            for updated in updated_jobs:
+                job = self._jobs_by_id.get(updated["id"])
+                if job is None:
+                    # not loaded yet, the next full refresh picks it up
+                    continue
+
+                # Update local cache
+                job.update(updated)
+                if job["status"] not in self.ACTIVE_STATUSES:
+                    # rendered once more below, then never polled again
+                    self._active_ids.discard(job["id"])
+
+                self._update_row(job)
+
+        # Update details panel if showing, it holds the same job dict
+        job = self._selected_job
+        if job and job["id"] in updated_ids:
+            sig = (job["status"], int(job["progress"]), job["error_message"])
+            if sig != self._details_sig:
+                self._details_sig = sig
+                self._update_details_panel(job)
 
     def _update_details_panel(self, job: TranscodeJob) -> None:
-        source_path = Path(job["source_file"])
         status_display = self.STATUS_DISPLAY.get(job["status"], job["status"])
-
-        details = f"""
-[b]{source_path.name}[/b]
-[b]Source:[/b] {job["source_file"]}
-[b]Destination:[/b] {job["destination_file"] or "N/A"}
-[b]Status:[/b] {status_display}
-[b]Created:[/b] {job["created_at"]}
-"""
+        parts = [
+            f"[b]{self._get_labels(job)[0]}[/b]",
+            f"[b]Source:[/b] {job['source_file']}",
+            f"[b]Destination:[/b] {job['destination_file'] or 'N/A'}",
+            f"[b]Status:[/b] {status_display}",
+            f"[b]Created:[/b] {job['created_at']}",
+            "",
+        ]
         if job["error_message"]:
-            details += f"\n[b]Error:[/b] [red]{job['error_message']}[/red]"
-
-        details += (
-            "\n\n[dim]Press 'c' to cancel, 'd' to remove, or 'esc' to close.[/dim]"
-        )
+            parts.append(_ERROR_FMT.format(job["error_message"]))
+        parts.extend(("", _DETAILS_FOOTER))
+        details = "\n".join(parts)
 
         progress = job["progress"] if job["status"] == "in_progress" else 0
         if job["status"] == "completed":
             progress = 100
 
-        self._details_panel.update_content(details.strip(), progress=progress)
+        # skip re-rendering the panel when nothing visible changed
+        if (details, progress) == self._details_content:
+            return
+        self._details_content = (details, progress)
+        self._details_panel.update_content(details, progress=progress)
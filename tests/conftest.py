@@ -8,7 +8,10 @@ import pytest
 from torrra._types import Indexer
 from torrra.app import TorrraApp
 from torrra.core import config as config_module
+from torrra.core import db as db_module
+from torrra.core import transcoder as transcoder_module
 from torrra.core.config import Config
+from torrra.core.transcoder import TranscodeManager
 
 
 @pytest.fixture
@@ -70,3 +73,29 @@ def mock_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 
     # this will now create a Config instance using the tmp_path
     return Config()
+
+
+@pytest.fixture
+def mock_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # fixture to point the shared db connection at a temp database
+    temp_db_dir = tmp_path / "data"
+    monkeypatch.setattr(db_module, "DB_DIR", temp_db_dir)
+    monkeypatch.setattr(db_module, "DB_FILE", temp_db_dir / "torrra.db")
+
+    # drop any connection opened against the real database
+    db_module.close_db_connection()
+    db_module.init_db()
+    yield temp_db_dir / "torrra.db"
+    db_module.close_db_connection()
+
+
+@pytest.fixture
+def tm(mock_db: Path, mock_config: Config, monkeypatch: pytest.MonkeyPatch):
+    # provides a transcode manager backed by a temp db and config
+    mock_config.config["general"]["download_path"] = "/downloads"
+    mock_config.config["transcoding"]["enabled"] = True
+    mock_config.config["transcoding"]["rules"] = [
+        {"input_extension": "mkv", "output_format": "mp4", "resolution": "720p"},
+    ]
+    monkeypatch.setattr(transcoder_module, "get_config", lambda: mock_config)
+    return TranscodeManager()
@@ -61,3 +61,35 @@ async def test_home_screen_search_no_results(app: TorrraApp, mock_indexer: Magic
 
         assert "Nothing Found" in str(loader_status.content)
         assert table.has_class("hidden")
+
+
+async def test_home_screen_search_dedupes_and_sorts(
+    app: TorrraApp, mock_indexer: MagicMock
+):
+    # tests that duplicate magnets show once and 's' toggles seeders order
+    def torrent(magnet: str, title: str, seeders: int) -> Torrent:
+        return Torrent(
+            magnet_uri=magnet,
+            title=title,
+            size=1024,
+            seeders=seeders,
+            leechers=0,
+            source="MockIndexer",
+        )
+
+    mock_indexer.search.return_value = [
+        torrent("magnet:?xt=urn:btih:a", "Few Seeders", 1),
+        torrent("magnet:?xt=urn:btih:b", "Many Seeders", 50),
+        torrent("magnet:?xt=urn:btih:a", "Few Seeders (dupe)", 1),
+    ]
+
+    async with app.run_test() as pilot:
+        table = cast(
+            DataTable[str], app.screen.query_one("SearchContent DataTable", DataTable)
+        )
+        assert table.row_count == 2
+        assert table.get_cell_at(Coordinate(0, 1)) == "Few Seeders"
+
+        await pilot.press("s")
+        assert table.row_count == 2
+        assert table.get_cell_at(Coordinate(0, 1)) == "Many Seeders"
@@ -0,0 +1,57 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from torrra.core.db import get_db_connection
+
+
+def test_connection_is_reused(mock_db: Path):
+    # tests that consecutive blocks share one long-lived connection
+    with get_db_connection() as conn1:
+        pass
+    with get_db_connection() as conn2:
+        pass
+    assert conn1 is conn2
+    # connection must still be usable after the block exits
+    assert conn2.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_connection_uses_wal(mock_db: Path):
+    # tests that the pragmas are applied on connect
+    with get_db_connection() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    assert mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+def test_connection_rolls_back_on_error(mock_db: Path):
+    # tests that an uncommitted write is discarded when the block raises
+    with pytest.raises(sqlite3.IntegrityError):
+        with get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO torrents (magnet_uri, title) VALUES ('a', 'first')"
+            )
+            conn.execute(
+                "INSERT INTO torrents (magnet_uri, title) VALUES ('a', 'dupe')"
+            )
+
+    with get_db_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM torrents").fetchone()[0]
+    assert count == 0
+
+
+def test_transcode_queue_uses_index(mock_db: Path):
+    # tests that pending job lookups are served by the status index
+    with get_db_connection() as conn:
+        plan = conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM transcode_jobs
+            WHERE status = 'pending' ORDER BY created_at ASC
+            """
+        ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "idx_transcode_status_created" in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from torrra._types import Torrent
+from torrra.core.torrent import TorrentManager
+
+
+def _torrent(name: str) -> Torrent:
+    return Torrent(
+        magnet_uri=f"magnet:?xt=urn:btih:{name}",
+        title=name,
+        size=0,
+        seeders=0,
+        leechers=0,
+        source="Direct Download",
+    )
+
+
+def test_update_torrents_metadata(mock_db: Path):
+    # tests that a batch of metadata updates is applied to every torrent
+    tm = TorrentManager()
+    for name in ("a", "b", "c"):
+        tm.add_torrent(_torrent(name))
+
+    tm.update_torrents_metadata([
+        ("magnet:?xt=urn:btih:a", "Title A", 100),
+        ("magnet:?xt=urn:btih:c", "Title C", 300),
+    ])
+
+    records = {t["magnet_uri"]: t for t in tm.get_all_torrents()}
+    assert records["magnet:?xt=urn:btih:a"]["title"] == "Title A"
+    assert records["magnet:?xt=urn:btih:a"]["size"] == 100
+    assert records["magnet:?xt=urn:btih:b"]["title"] == "b"
+    assert records["magnet:?xt=urn:btih:c"]["size"] == 300
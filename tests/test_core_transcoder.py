@@ -0,0 +1,355 @@
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from torrra.core import transcoder as transcoder_module
+from torrra.core.config import Config
+from torrra.core.db import get_db_connection
+from torrra.core.transcoder import TranscodeManager, TranscodeRule, VideoProbe
+
+
+def test_queue_jobs_returns_inserted_ids(tm: TranscodeManager):
+    # tests that a batch insert returns the ids of the created rows
+    first_id = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    rows = [
+        ("magnet:?xt=urn:btih:b", f"/downloads/{name}.mkv", f"/out/{name}.mp4")
+        for name in ("b", "c", "d")
+    ]
+    job_ids = tm.queue_jobs(rows)
+
+    assert job_ids == [first_id + 1, first_id + 2, first_id + 3]
+    jobs = {job["id"]: job for job in tm.get_all_jobs()}
+    assert [jobs[i]["source_file"] for i in job_ids] == [r[1] for r in rows]
+
+
+def test_queue_jobs_empty(tm: TranscodeManager):
+    # tests that an empty batch does not touch the db
+    assert tm.queue_jobs([]) == []
+    assert tm.get_all_jobs() == []
+
+
+def test_queue_job_without_rule_raises(tm: TranscodeManager):
+    # tests that files with no matching rule are rejected
+    with pytest.raises(ValueError, match="No matching rule"):
+        tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.avi")
+
+
+async def test_progress_updates_are_buffered(tm: TranscodeManager):
+    # tests that progress ticks only reach the db when flushed
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    tm.update_job_progress(job_id, 10.0)
+    tm.update_job_progress(job_id, 42.0)
+    assert tm.get_all_jobs()[0]["progress"] == 0
+
+    tm.flush_progress()
+    assert tm.get_all_jobs()[0]["progress"] == 42.0
+
+
+async def test_progress_flusher_outlives_steady_updates(
+    tm: TranscodeManager, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that one flusher task keeps writing while updates keep coming
+    monkeypatch.setattr(transcoder_module, "PROGRESS_FLUSH_INTERVAL", 0.05)
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    tm.update_job_progress(job_id, 10.0)
+    flusher = tm._progress_flusher
+    assert flusher is not None
+
+    await asyncio.sleep(0.075)
+    assert tm.get_all_jobs()[0]["progress"] == 10.0
+    tm.update_job_progress(job_id, 20.0)
+    assert tm._progress_flusher is flusher
+
+    await asyncio.sleep(0.05)
+    assert tm.get_all_jobs()[0]["progress"] == 20.0
+    await asyncio.sleep(0.1)
+    assert flusher.done()
+
+
+async def test_status_update_flushes_progress(tm: TranscodeManager):
+    # tests that a state transition writes buffered progress first
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    tm.update_job_progress(job_id, 55.0)
+    tm.update_job_status(job_id, "cancelled")
+
+    job = tm.get_all_jobs()[0]
+    assert job["status"] == "cancelled"
+    assert job["progress"] == 55.0
+
+
+def test_parse_ffmpeg_progress(tm: TranscodeManager):
+    # tests that raw progress lines are turned into a capped percentage
+    tm._progress_scales[1] = 100e-6 / 200  # 200 second video
+    assert tm.parse_ffmpeg_progress(b"out_time_ms=50000000\n", 1) == 25.0
+    assert tm.parse_ffmpeg_progress(b"out_time_ms=900000000\n", 1) == 99.9
+    assert tm.parse_ffmpeg_progress(b"out_time_ms=N/A\n", 1) is None
+    assert tm.parse_ffmpeg_progress(b"frame=120\n", 1) is None
+    # unknown duration
+    assert tm.parse_ffmpeg_progress(b"out_time_ms=50000000\n", 2) is None
+
+
+def test_get_matching_rule(tm: TranscodeManager, mock_config: Config):
+    # tests extension lookup with and without a leading dot in the rule
+    assert tm.get_matching_rule("/downloads/Movie.MKV") is not None
+    assert tm.get_matching_rule("/downloads/movie.avi") is None
+
+    # replacing the rules list is picked up without explicit invalidation
+    mock_config.config["transcoding"]["rules"] = [
+        {"input_extension": ".avi", "output_format": "mp4", "resolution": "original"},
+    ]
+    assert tm.get_matching_rule("/downloads/movie.avi") is not None
+    assert tm.get_matching_rule("/downloads/movie.mkv") is None
+
+
+def test_get_active_jobs(tm: TranscodeManager):
+    # tests that running jobs come before pending ones and finished are skipped
+    ids = [
+        tm.queue_job("magnet:?xt=urn:btih:a", f"/downloads/{name}.mkv")
+        for name in ("a", "b", "c", "d")
+    ]
+    tm.update_job_status(ids[0], "completed", progress=100)
+    tm.update_job_status(ids[2], "in_progress", progress=0)
+
+    active = tm.get_active_jobs()
+    assert [job["id"] for job in active] == [ids[2], ids[1], ids[3]]
+    assert tm.get_status_counts() == {"completed": 1, "in_progress": 1, "pending": 2}
+
+
+def test_get_updated_jobs(tm: TranscodeManager):
+    # tests that only jobs written at or after the watermark are returned
+    first = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    second = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/b.mkv")
+    with get_db_connection() as conn:
+        conn.execute("UPDATE transcode_jobs SET updated_at = 1.0")
+        conn.commit()
+
+    assert len(tm.get_updated_jobs(1.0)) == 2
+    assert tm.get_job_count() == 2
+    tm.update_job_status(second, "in_progress", progress=10.0)
+    jobs = tm.get_updated_jobs(2.0)
+    assert [job["id"] for job in jobs] == [second]
+    assert jobs[0]["updated_at"] > 1.0
+    assert first not in {job["id"] for job in tm.get_updated_jobs(2.0)}
+
+
+async def test_job_is_claimed_before_probing(
+    tm: TranscodeManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that a job still being probed is not started again by the queue
+    source = tmp_path / "a.mkv"
+    source.touch()
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", str(source))
+    release = asyncio.Event()
+    probes: list[str] = []
+
+    async def slow_probe(file_path: str) -> VideoProbe | None:
+        probes.append(file_path)
+        await release.wait()
+        raise OSError("probe failed")
+
+    monkeypatch.setattr(tm, "probe_video", slow_probe)
+    await tm.process_queue_async()
+    await asyncio.sleep(0)
+    assert tm.get_all_jobs()[0]["status"] == "in_progress"
+
+    await tm.process_queue_async()
+    await asyncio.sleep(0)
+    assert probes == [str(source)]
+
+    release.set()
+    await asyncio.sleep(0.01)
+    job = tm.get_all_jobs()[0]
+    assert job["id"] == job_id
+    assert job["status"] == "failed"
+
+
+async def test_read_progress_handles_split_lines(tm: TranscodeManager):
+    # tests that lines split across chunks are reassembled
+    tm._progress_scales[1] = 100e-6 / 100  # 100 second video
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"frame=1\nout_time_ms=10000000\nout_time")
+    stream.feed_data(b"_ms=20000000\nprogress=continue\n")
+    stream.feed_eof()
+
+    await tm._read_progress(stream, 1)
+    assert tm._progress_buffer[1] == 20.0
+
+
+async def test_notify_sync_and_async_callbacks(tm: TranscodeManager):
+    # tests that both plain and coroutine callbacks receive notifications
+    received: list[tuple[str, str]] = []
+
+    def sync_callback(event: str, filename: str) -> None:
+        received.append((event, filename))
+
+    async def async_callback(event: str, filename: str) -> None:
+        received.append((event, filename))
+
+    await tm._notify("started", "ignored.mkv")  # no callback set yet
+    tm.set_notification_callback(sync_callback)
+    await tm._notify("started", "a.mkv")
+    tm.set_notification_callback(async_callback)
+    await tm._notify("completed", "a.mkv")
+    tm.set_notification_callback(lambda event, name: async_callback(event, name))
+    await tm._notify("failed", "b.mkv")
+
+    assert received == [
+        ("started", "a.mkv"),
+        ("completed", "a.mkv"),
+        ("failed", "b.mkv"),
+    ]
+
+
+async def test_read_stderr_tail_is_bounded(tm: TranscodeManager):
+    # tests that only the end of a large stderr stream is kept
+    stream = asyncio.StreamReader()
+    for i in range(100):
+        stream.feed_data(f"line {i:03d} of noisy ffmpeg output\n".encode() * 50)
+    stream.feed_data(b"Error: invalid data found\n")
+    stream.feed_eof()
+
+    tail = await tm._read_stderr_tail(stream)
+    assert len(tail) == transcoder_module.STDERR_TAIL_SIZE
+    assert tail.endswith(b"Error: invalid data found\n")
+
+
+async def test_failed_job_stops_stderr_reader(
+    tm: TranscodeManager,
+    mock_config: Config,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # tests that an unexpected error does not leave the stderr reader running
+    mock_config.config["transcoding"]["destination_path"] = str(tmp_path / "out")
+    source = tmp_path / "a.mkv"
+    source.touch()
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", str(source))
+
+    class BrokenProcess:
+        returncode = None
+
+        def __init__(self) -> None:
+            self.stdout = asyncio.StreamReader()
+            self.stdout.set_exception(OSError("pipe broke"))
+            self.stderr = asyncio.StreamReader()  # never fed, reader would hang
+
+    async def fake_exec(*_args: object, **_kwargs: object) -> BrokenProcess:
+        return BrokenProcess()
+
+    async def no_probe(_file_path: str) -> VideoProbe | None:
+        return None
+
+    monkeypatch.setattr(tm, "probe_video", no_probe)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+    await tm.start_job_async(job_id, tm.get_all_jobs()[0])
+    await asyncio.sleep(0)
+
+    job = tm.get_all_jobs()[0]
+    assert job["status"] == "failed"
+    assert job["error_message"] == "pipe broke"
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    assert job_id not in tm._active_processes
+
+
+def test_check_ffmpeg_available_is_cached(
+    mock_config: Config, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that ffmpeg is only spawned once per configured path
+    calls: list[list[str]] = []
+
+    def fake_run(
+        cmd: list[str], **_kwargs: object
+    ) -> subprocess.CompletedProcess[bytes]:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(transcoder_module, "get_config", lambda: mock_config)
+    monkeypatch.setattr(transcoder_module.subprocess, "run", fake_run)
+    transcoder_module._check_ffmpeg.cache_clear()
+
+    assert transcoder_module.check_ffmpeg_available()
+    assert transcoder_module.check_ffmpeg_available()
+    assert calls == [["ffmpeg", "-version"]]
+    transcoder_module._check_ffmpeg.cache_clear()
+
+
+def _probe(video: str, height: int, audio: str) -> VideoProbe:
+    return VideoProbe(
+        duration=60.0, video_codec=video, height=height, audio_codec=audio
+    )
+
+
+def test_build_ffmpeg_command_copies_matching_h264(tm: TranscodeManager):
+    # tests the stream-copy fast path for sources that already fit the rule
+    rule = TranscodeRule(input_extension="mkv", output_format="mp4", resolution="1080p")
+    cmd = tm.build_ffmpeg_command("in.mkv", "out.mp4", rule, _probe("h264", 720, "aac"))
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert cmd[cmd.index("-c:a") + 1] == "copy"
+    assert "-vf" not in cmd
+
+    # non-aac audio is still re-encoded next to the copied video
+    cmd = tm.build_ffmpeg_command("in.mkv", "out.mp4", rule, _probe("h264", 720, "ac3"))
+    assert cmd[cmd.index("-c:v") + 1] == "copy"
+    assert cmd[cmd.index("-c:a") + 1] == "aac"
+
+
+def test_build_ffmpeg_command_reencodes(tm: TranscodeManager):
+    # tests that other codecs, larger sources or no probe get re-encoded
+    rule = TranscodeRule(input_extension="mkv", output_format="mp4", resolution="720p")
+    for probe in (_probe("hevc", 720, "aac"), _probe("h264", 1080, "aac"), None):
+        cmd = tm.build_ffmpeg_command("in.mkv", "out.mp4", rule, probe)
+        assert cmd[cmd.index("-c:v") + 1] == "libx264"
+        assert cmd[cmd.index("-vf") + 1] == "scale=-2:720"
+        assert cmd[cmd.index("-c:a") + 1] == "aac"
+
+
+def test_build_ffmpeg_command_hw_encoder(tm: TranscodeManager):
+    # tests that a hardware encoder replaces libx264 with its own options
+    rule = TranscodeRule(input_extension="mkv", output_format="mp4", resolution="720p")
+    cmd = tm.build_ffmpeg_command("in.mkv", "out.mp4", rule, hw_encoder="vaapi")
+    assert cmd[cmd.index("-c:v") + 1] == "h264_vaapi"
+    assert cmd.index("-vaapi_device") < cmd.index("-i")
+    assert cmd[cmd.index("-vf") + 1] == "scale=-2:720,format=nv12,hwupload"
+
+
+async def test_get_hw_encoder_skips_unusable(
+    tm: TranscodeManager, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that compiled-in encoders failing a test encode are not picked
+    listed: list[str] = []
+
+    async def fake_encoders(ffmpeg_path: str) -> frozenset[str]:
+        listed.append(ffmpeg_path)
+        return frozenset({"libx264", "h264_nvenc", "h264_qsv"})
+
+    async def fake_works(_ffmpeg_path: str, name: str) -> bool:
+        return name == "qsv"
+
+    monkeypatch.setattr(transcoder_module, "_ffmpeg_encoders", fake_encoders)
+    monkeypatch.setattr(transcoder_module, "_hw_encoder_works", fake_works)
+
+    monkeypatch.setattr(tm, "_hwaccel", "auto")
+    assert await tm.get_hw_encoder() == "qsv"
+    assert await tm.get_hw_encoder() == "qsv"
+    assert listed == ["ffmpeg"]
+
+    for hwaccel in ("nvenc", "none"):
+        monkeypatch.setattr(tm, "_hwaccel", hwaccel)
+        monkeypatch.setattr(tm, "_hw_encoder_task", None)
+        assert await tm.get_hw_encoder() is None
+
+
+def test_parse_probe():
+    # tests picking the relevant fields from ffprobe json output
+    probe = transcoder_module._parse_probe({
+        "streams": [
+            {"codec_type": "video", "codec_name": "h264", "height": 1080},
+            {"codec_type": "audio", "codec_name": "eac3"},
+            {"codec_type": "audio", "codec_name": "aac"},
+        ],
+        "format": {"duration": "5400.25"},
+    })
+    assert probe == _probe("h264", 1080, "eac3") | {"duration": 5400.25}
+    assert transcoder_module._parse_probe({})["duration"] is None
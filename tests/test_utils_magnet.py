@@ -40,3 +40,17 @@ async def test_resolve_unhandled_url_returns_none():
 
     resolved = await resolve_magnet_uri(test_url)
     assert resolved is None
+
+
+@respx.mock
+async def test_resolve_caches_resolved_uri():
+    # tests that a resolved url is not requested again
+    test_url = "http://test.com/cached"
+    magnet_uri = "magnet:?xt=urn:btih:cached"
+    route = respx.get(test_url).mock(
+        httpx.Response(302, headers={"location": magnet_uri})
+    )
+
+    assert await resolve_magnet_uri(test_url) == magnet_uri
+    assert await resolve_magnet_uri(test_url) == magnet_uri
+    assert route.call_count == 1
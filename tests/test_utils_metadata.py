@@ -0,0 +1,78 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import libtorrent as lt
+import pytest
+
+from torrra.core import download as download_module
+from torrra.core.cache import Cache
+from torrra.core.config import Config
+from torrra.utils import metadata as metadata_module
+from torrra.utils.metadata import TorrentFile, fetch_torrent_files
+
+INFO_HASH = "0123456789abcdef0123456789abcdef01234567"
+MAGNET = f"magnet:?xt=urn:btih:{INFO_HASH}"
+
+
+async def test_fetch_torrent_files_respects_use_cache(
+    tmp_path: Path, mock_config: Config, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that use_cache=False neither reads nor fills the files cache
+    files_cache = Cache(tmp_path / "cache")
+    monkeypatch.setattr(metadata_module, "cache", files_cache)
+    monkeypatch.setattr(
+        download_module,
+        "get_download_manager",
+        lambda: SimpleNamespace(torrents={}),
+    )
+    fetched: list[str | None] = []
+
+    async def fake_fetch(
+        _magnet_uri: str, _atp: Any, files_key: str | None, _timeout: float
+    ) -> list[TorrentFile] | None:
+        fetched.append(files_key)
+        return [TorrentFile(path="fresh.mkv", size=2)]
+
+    monkeypatch.setattr(metadata_module, "_fetch_from_session", fake_fetch)
+
+    files_cache.set(files_cache.make_key("files", INFO_HASH), [("cached.mkv", 1)])
+
+    cached = await fetch_torrent_files(MAGNET)
+    assert cached == [TorrentFile(path="cached.mkv", size=1)]
+    assert fetched == []
+
+    fresh = await fetch_torrent_files(MAGNET, use_cache=False)
+    assert fresh == [TorrentFile(path="fresh.mkv", size=2)]
+    assert fetched == [None]
+    files_cache.close()
+
+
+async def test_temporary_torrent_is_not_paused(monkeypatch: pytest.MonkeyPatch):
+    # tests that the metadata-only torrent actually runs in the session
+    session = lt.session({
+        "listen_interfaces": "127.0.0.1:0",
+        "enable_dht": False,
+        "enable_lsd": False,
+        "enable_upnp": False,
+        "enable_natpmp": False,
+    })
+    seen: list[tuple[bool, bool]] = []
+
+    async def fake_wait(handle: lt.torrent_handle, _timeout: float) -> bool:
+        flags = handle.flags()
+        seen.append((
+            bool(flags & lt.torrent_flags.paused),
+            bool(flags & lt.torrent_flags.auto_managed),
+        ))
+        return False
+
+    manager = SimpleNamespace(
+        session=session, torrents={}, wait_for_metadata=fake_wait
+    )
+    monkeypatch.setattr(download_module, "get_download_manager", lambda: manager)
+
+    atp = lt.parse_magnet_uri(MAGNET)
+    assert await metadata_module._fetch_from_session(MAGNET, atp, None, 1.0) is None
+    assert seen == [(False, False)]
+    assert session.get_torrents() == []
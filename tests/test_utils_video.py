@@ -0,0 +1,36 @@
+import pytest
+
+from torrra.core import config as config_module
+from torrra.core.config import Config
+from torrra.utils.video import detect_video_extension, is_transcodable_extension
+
+
+def test_detect_video_extension():
+    # tests extensions at the end of the title or before a bracket/space
+    assert detect_video_extension("Movie.Name.2024.1080p.BluRay.x264.MKV") == ".mkv"
+    assert detect_video_extension("Movie Name (2024) [movie.mp4]") == ".mp4"
+    assert detect_video_extension("Concert.m2ts (Remux)") == ".m2ts"
+    assert detect_video_extension("Show.mpeg") == ".mpeg"
+
+
+def test_detect_video_extension_no_match():
+    # tests that extensions inside words or missing ones are ignored
+    assert detect_video_extension("Movie.avif.pack") is None
+    assert detect_video_extension("Ubuntu 24.04 Desktop ISO") is None
+
+
+def test_is_transcodable_extension(
+    mock_config: Config, monkeypatch: pytest.MonkeyPatch
+):
+    # tests rule matching and that replaced rules are picked up
+    mock_config.config["transcoding"]["enabled"] = True
+    mock_config.config["transcoding"]["rules"] = [{"input_extension": "mkv"}]
+    monkeypatch.setattr(config_module, "get_config", lambda: mock_config)
+
+    assert is_transcodable_extension("MKV")
+    assert is_transcodable_extension(".mkv")
+    assert not is_transcodable_extension("avi")
+
+    mock_config.config["transcoding"]["rules"] = [{"input_extension": ".avi"}]
+    assert is_transcodable_extension("avi")
+    assert not is_transcodable_extension("mkv")
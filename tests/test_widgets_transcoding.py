@@ -0,0 +1,79 @@
+from typing import cast
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable
+
+from torrra.core.transcoder import TranscodeManager
+from torrra.widgets import transcoding as transcoding_module
+from torrra.widgets.transcoding import TranscodingContent
+
+
+class TranscodingApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield TranscodingContent()
+
+
+def _row_keys(table: DataTable[str]) -> list[str]:
+    return [cast(str, row.key.value) for row in table.ordered_rows]
+
+
+async def test_refresh_jobs_reuses_rows(
+    tm: TranscodeManager, monkeypatch: pytest.MonkeyPatch
+):
+    # tests that refreshes add/remove only changed rows and keep job order
+    monkeypatch.setattr(transcoding_module, "get_transcode_manager", lambda: tm)
+    first = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+    second = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/b.mkv")
+
+    app = TranscodingApp()
+    async with app.run_test():
+        await app.workers.wait_for_complete()
+        content = app.query_one(TranscodingContent)
+        table = cast(DataTable[str], content.query_one(DataTable))
+        assert table.row_count == 2
+        first_row = table.rows[str(first)]
+
+        third = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/c.mkv")
+        tm.remove_job(second)
+        await content.update_table_data()  # same count, no refresh yet
+        await content._refresh_jobs()
+
+        assert _row_keys(table) == [str(job["id"]) for job in tm.get_all_jobs()]
+        assert set(_row_keys(table)) == {str(first), str(third)}
+        assert table.rows[str(first)] is first_row
+        numbers = [table.get_row_at(i)[0] for i in range(table.row_count)]
+        assert numbers == ["1", "2"]
+
+
+async def test_details_text_layout(
+    tm: TranscodeManager, monkeypatch: pytest.MonkeyPatch
+):
+    # tests the details markup with and without an error message
+    monkeypatch.setattr(transcoding_module, "get_transcode_manager", lambda: tm)
+    job_id = tm.queue_job("magnet:?xt=urn:btih:a", "/downloads/a.mkv")
+
+    app = TranscodingApp()
+    async with app.run_test():
+        await app.workers.wait_for_complete()
+        content = app.query_one(TranscodingContent)
+        job = content._jobs_by_id[job_id]
+        fields = (
+            "[b]a.mkv[/b]\n"
+            "[b]Source:[/b] /downloads/a.mkv\n"
+            "[b]Destination:[/b] /downloads/a.mp4\n"
+            "[b]Status:[/b] {}\n"
+            f"[b]Created:[/b] {job['created_at']}\n"
+        )
+        footer = "[dim]Press 'c' to cancel, 'd' to remove, or 'esc' to close.[/dim]"
+
+        assert content._details_content
+        assert content._details_content[0] == (
+            fields.format("Pending") + "\n\n" + footer
+        )
+
+        job.update(status="failed", error_message="boom")
+        content._update_details_panel(job)
+        assert content._details_content[0] == (
+            fields.format("Failed") + "\n[b]Error:[/b] [red]boom[/red]\n\n" + footer
+        )